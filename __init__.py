@@ -3,20 +3,33 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from datetime import timedelta
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum, StrEnum
 import functools
+from itertools import compress
 import logging
+import math
+import random
+import re
 import time
 from typing import Any, Union
 
-from asyncua import Client, ua
+from asyncua import Client, Node, ua
 from asyncua.common import ua_utils
 from asyncua.ua.uatypes import DataValue
 import voluptuous as vol
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant
+    np = None
+
+from homeassistant.components.recorder.statistics import async_import_statistics
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -25,36 +38,129 @@ from homeassistant.exceptions import (
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_component import DEFAULT_SCAN_INTERVAL
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_NODE_HUB,
     ATTR_NODE_ID,
+    ATTR_PRIORITY,
     ATTR_VALUE,
     CONF_HUB_ID,
     CONF_HUB_MANUFACTURER,
     CONF_HUB_MODEL,
     CONF_HUB_PASSWORD,
+    CONF_HUB_PERSISTENT_SESSION,
     CONF_HUB_SCAN_INTERVAL,
+    CONF_HUB_SUBSCRIPTION,
     CONF_HUB_URL,
+    CONF_HUB_FAILOVER_URLS,
     CONF_HUB_USERNAME,
+    CONF_HUB_WRITE_COALESCE,
+    CONF_NODE_DEADBAND,
+    CONF_NODE_DEADBAND_PERCENT,
+    CONF_NODE_BIT,
     CONF_NODE_ID,
+    CONF_NODE_INDEX,
     CONF_NODE_NAME,
+    CONF_NODE_SCAN_INTERVAL,
+    DEFAULT_BACKFILL_DELAY,
+    DEFAULT_BACKOFF_INITIAL,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_HISTORY_PAGE_SIZE,
+    DEFAULT_LATENCY_PREFERENCE,
+    DEFAULT_MAX_NODES_PER_READ,
+    DEFAULT_PUBLISHING_INTERVAL,
+    DEFAULT_QUARANTINE_RETRY,
+    DEFAULT_READ_CONCURRENCY,
+    DEFAULT_WRITE_QUEUE_DEPTH,
     DOMAIN,
+    MIN_COORDINATOR_INTERVAL,
     SERVICE_SET_VALUE,
 )
+from .history import HourlyMean, ceil_hour, floor_hour
 
 _LOGGER = logging.getLogger("asyncua")
 _LOGGER.setLevel(logging.WARNING)
 
+"""Status words are unpacked as unsigned, at most 64 bits"""
+WORD_MASK = (1 << 64) - 1
+
+PLATFORMS = ["sensor", "binary_sensor", "switch", "cover", "light", "climate"]
+
+"""Status codes meaning the session or secure channel is gone, not the node"""
+SESSION_STATUS_CODES = frozenset(
+    {
+        ua.StatusCodes.BadSessionIdInvalid,
+        ua.StatusCodes.BadSessionClosed,
+        ua.StatusCodes.BadSessionNotActivated,
+        ua.StatusCodes.BadSecureChannelIdInvalid,
+        ua.StatusCodes.BadSecureChannelClosed,
+        ua.StatusCodes.BadConnectionClosed,
+        ua.StatusCodes.BadServerNotConnected,
+        ua.StatusCodes.BadNotConnected,
+        ua.StatusCodes.BadCommunicationError,
+    }
+)
+
+
+"""Status codes of a server, or node, that keeps no history"""
+HISTORY_UNSUPPORTED_CODES = frozenset(
+    {
+        ua.StatusCodes.BadServiceUnsupported,
+        ua.StatusCodes.BadHistoryOperationUnsupported,
+        ua.StatusCodes.BadHistoryOperationInvalid,
+        ua.StatusCodes.BadNotSupported,
+        ua.StatusCodes.BadNotReadable,
+        ua.StatusCodes.BadUserAccessDenied,
+    }
+)
+
+
+class HubState(StrEnum):
+    """Connection state of a hub."""
+
+    CONNECTED = "connected"
+    # Calls failed, fewer than failure_threshold in a row; still attempted
+    DEGRADED = "degraded"
+    # Circuit open, the probe task reconnects with a growing delay
+    BACKING_OFF = "backing_off"
+    # Circuit open and the probe delay has reached its maximum
+    OPEN_CIRCUIT = "open_circuit"
+
+
+class WritePriority(IntEnum):
+    """Lanes of the hub write scheduler, lowest value is written first."""
+
+    STOP = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+
+"""Value of a queued write replaced by a newer write to the same node"""
+_SUPERSEDED = object()
+
+
 BASE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HUB_ID): cv.string,
         vol.Required(CONF_HUB_URL): cv.string,
+        vol.Optional(CONF_HUB_FAILOVER_URLS, default=[]): vol.All(
+            cv.ensure_list, [cv.string]
+        ),
         vol.Optional(CONF_HUB_MANUFACTURER, default=""): cv.string,
         vol.Optional(CONF_HUB_MODEL, default=""): cv.string,
         vol.Optional(CONF_HUB_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(CONF_HUB_PERSISTENT_SESSION, default=True): cv.boolean,
+        vol.Optional(CONF_HUB_SUBSCRIPTION, default=False): cv.boolean,
+        vol.Optional(CONF_HUB_WRITE_COALESCE): cv.positive_int,
         vol.Inclusive(CONF_HUB_USERNAME, None): cv.string,
         vol.Inclusive(CONF_HUB_PASSWORD, None): cv.string,
     }
@@ -72,6 +178,9 @@ SERVICE_SET_VALUE_SCHEMA = vol.Schema(
             cv.boolean,
             cv.time,
         ),
+        vol.Optional(
+            ATTR_PRIORITY, default=WritePriority.INTERACTIVE.name.lower()
+        ): vol.In([priority.name.lower() for priority in WritePriority]),
     }
 )
 
@@ -100,6 +209,7 @@ async def async_setup(
         await hub.set_value(
             nodeid=service.data[ATTR_NODE_ID],
             value=service.data[ATTR_VALUE],
+            priority=WritePriority[service.data[ATTR_PRIORITY].upper()],
         )
         return True
 
@@ -128,8 +238,13 @@ async def async_setup(
                     hub_manufacturer=hub[CONF_HUB_MANUFACTURER],
                     hub_model=hub[CONF_HUB_MODEL],
                     hub_url=hub[CONF_HUB_URL],
+                    failover_urls=hub[CONF_HUB_FAILOVER_URLS],
                     username=hub.get(CONF_HUB_USERNAME),
                     password=hub.get(CONF_HUB_PASSWORD),
+                    persistent_session=hub[CONF_HUB_PERSISTENT_SESSION],
+                    write_coalesce_window=_coalesce_window(
+                        hub.get(CONF_HUB_WRITE_COALESCE)
+                    ),
                 ),
                 update_interval_in_second=timedelta(
                     seconds=hub.get(
@@ -137,11 +252,21 @@ async def async_setup(
                         DEFAULT_SCAN_INTERVAL,
                     ),
                 ),
+                subscription=hub[CONF_HUB_SUBSCRIPTION],
             )
             # For YAML config, we can refresh immediately as it's not a config entry
             await coordinator.async_refresh()
             hass.data[DOMAIN][hub[CONF_HUB_ID]] = coordinator
 
+            # YAML hubs have no unload path, close the session on shutdown
+            async def _async_close_session(_event: Event) -> None:
+                await coordinator.async_shutdown()
+                await coordinator.hub.async_disconnect()
+
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, _async_close_session
+            )
+
         configure_hub_tasks = [_configure_hub(hub) for hub in config[DOMAIN]]
         await asyncio.gather(*configure_hub_tasks)
 
@@ -157,6 +282,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await hub.set_value(
             nodeid=service.data[ATTR_NODE_ID],
             value=service.data[ATTR_VALUE],
+            priority=WritePriority[service.data[ATTR_PRIORITY].upper()],
         )
         return True
 
@@ -185,8 +311,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 hub_manufacturer=entry.data.get(CONF_HUB_MANUFACTURER, ""),
                 hub_model=entry.data.get(CONF_HUB_MODEL, ""),
                 hub_url=entry.data[CONF_HUB_URL],
+                failover_urls=_failover_urls(entry.data.get(CONF_HUB_FAILOVER_URLS)),
                 username=entry.data.get(CONF_HUB_USERNAME),
                 password=entry.data.get(CONF_HUB_PASSWORD),
+                persistent_session=entry.data.get(
+                    CONF_HUB_PERSISTENT_SESSION, True
+                ),
+                write_coalesce_window=_coalesce_window(
+                    entry.data.get(CONF_HUB_WRITE_COALESCE)
+                ),
             ),
             update_interval_in_second=timedelta(
                 seconds=entry.data.get(
@@ -194,6 +327,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     DEFAULT_SCAN_INTERVAL,
                 ),
             ),
+            subscription=entry.data.get(CONF_HUB_SUBSCRIPTION, False),
         )
         
         # This is the correct place to call async_config_entry_first_refresh
@@ -201,15 +335,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_config_entry_first_refresh()
         
         hass.data[DOMAIN][hub_id] = coordinator
+
+        async def _async_close_session(_event: Event) -> None:
+            await coordinator.async_shutdown()
+            await coordinator.hub.async_disconnect()
+
+        entry.async_on_unload(
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, _async_close_session
+            )
+        )
     
     # Initialize callback storage for dynamic entity addition
     if not hasattr(coordinator, '_add_entities_callbacks'):
         coordinator._add_entities_callbacks = {}
 
     # Forward setup to all platforms
-    await hass.config_entries.async_forward_entry_setups(
-        entry, ["sensor", "binary_sensor", "switch", "cover", "light", "climate"]
-    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
@@ -217,13 +359,301 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     hub_id = entry.data[CONF_HUB_ID]
-    
+
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not unload_ok:
+        return False
+
     if hub_id in hass.data[DOMAIN]:
-        hass.data[DOMAIN].pop(hub_id)
+        coordinator = hass.data[DOMAIN].pop(hub_id)
+        await coordinator.async_shutdown()
+        await coordinator.hub.async_disconnect()
     
     return True
 
 
+def _coalesce_window(milliseconds: int | None) -> float | None:
+    """Return the write coalescing window in seconds, None when disabled."""
+    return None if milliseconds is None else milliseconds / 1000
+
+
+def _failover_urls(urls: str | list[str] | None) -> list[str]:
+    """Return the standby endpoints of a hub, given as a list or comma separated."""
+    if not urls:
+        return []
+    if isinstance(urls, str):
+        urls = urls.split(",")
+    return [url.strip() for url in urls if url.strip()]
+
+
+"""A NodeId string addressing one element of an array node, e.g. ns=2;s=Temps[5]"""
+ARRAY_ELEMENT_PATTERN = re.compile(r"^(?P<nodeid>.+)\[(?P<index>\d+)\]$")
+
+
+def split_array_nodeid(nodeid: str) -> tuple[str, int | None]:
+    """Return the array nodeid and element index of nodeid[index]."""
+    match = ARRAY_ELEMENT_PATTERN.match(nodeid)
+    if match is None:
+        return nodeid, None
+    return match["nodeid"], int(match["index"])
+
+
+def normalize_nodeid(nodeid: str) -> str:
+    """Return the canonical string form of a NodeId string."""
+    return ua.NodeId.from_string(nodeid).to_string()
+
+
+class _DataChangeHandler:
+    """Forward asyncua data change notifications to the hub."""
+
+    def __init__(self, hub: OpcuaHub) -> None:
+        """Initialize the handler."""
+        self._hub = hub
+
+    def datachange_notification(self, node: Any, val: Any, data: Any) -> None:
+        """Handle a data change notification of one monitored item."""
+        self._hub.handle_data_change(nodeid=node.nodeid.to_string(), value=val)
+
+    def status_change_notification(self, status: Any) -> None:
+        """Handle a subscription status change."""
+        _LOGGER.debug("Subscription status change on %s: %s", self._hub.hub_name, status)
+
+
+class OpcuaSession:
+    """One asyncua Client and its long-lived session, shared between hubs.
+
+    Hubs with a persistent session and the same endpoint URL and credentials
+    share one OpcuaSession from a process-wide, reference counted registry.
+    Value reads the hubs submit in the same event loop turn are merged into
+    one Read request, up to the server MaxNodesPerRead.
+    """
+
+    _registry: dict[tuple[str, str | None, str | None], OpcuaSession] = {}
+
+    def __init__(
+        self,
+        url: str,
+        username: str | None = None,
+        password: str | None = None,
+        read_concurrency: int = DEFAULT_READ_CONCURRENCY,
+    ) -> None:
+        """Initialize the session."""
+        self._url = url
+        self._key = (url, username, password)
+        self._refs = 0
+        self._lock = asyncio.Lock()
+        self._active: bool = False
+        self.generation: int = 0
+
+        """Asyncua client"""
+        self.client: Client = Client(
+            url=url,
+            timeout=5,
+        )
+        self.client.secure_channel_timeout = 60000  # 1 minute
+        self.client.session_timeout = 60000  # 1 minute
+        if username is not None:
+            self.client.set_user(username=username)
+        if password is not None:
+            self.client.set_password(pwd=password)
+
+        """Server OperationLimits, probed once per session"""
+        self._operation_limits: dict[int, int] = {}
+        self._read_semaphore = asyncio.Semaphore(read_concurrency)
+
+        """Value reads waiting to be merged into one Read request"""
+        self._pending_reads: list[
+            tuple[list[Node], list[str | None] | None, asyncio.Future]
+        ] = []
+        self._read_flush_task: asyncio.Task | None = None
+
+    @classmethod
+    def acquire(
+        cls,
+        url: str,
+        username: str | None = None,
+        password: str | None = None,
+        read_concurrency: int = DEFAULT_READ_CONCURRENCY,
+    ) -> OpcuaSession:
+        """Return the shared session of an endpoint, creating it if needed."""
+        key = (url, username, password)
+        session = cls._registry.get(key)
+        if session is None:
+            session = cls._registry[key] = cls(
+                url, username, password, read_concurrency
+            )
+        session._refs += 1
+        return session
+
+    @property
+    def shared(self) -> bool:
+        """Return True if more than one hub uses this session."""
+        return self._refs > 1
+
+    @property
+    def active(self) -> bool:
+        """Return True while the session is open."""
+        return self._active
+
+    async def async_release(self) -> None:
+        """Drop one reference, closing the session once no hub uses it."""
+        self._refs -= 1
+        if self._refs > 0:
+            return
+        if self._registry.get(self._key) is self:
+            del self._registry[self._key]
+        async with self._lock:
+            if self._active:
+                await self._async_close()
+
+    async def async_connect(self) -> None:
+        """Open the session, or reconnect if it has failed.
+
+        Keepalive and secure channel renewal run inside the asyncua client
+        for as long as the session is open; check_connection surfaces any
+        failure of those background tasks. generation is bumped on every
+        new session so hubs know to redo their session-scoped setup.
+        """
+        async with self._lock:
+            if self._active:
+                try:
+                    await self.client.check_connection()
+                    return
+                except Exception as e:  # pylint: disable=broad-except
+                    _LOGGER.warning(
+                        "Session to %s lost, reconnecting: %s", self._url, e
+                    )
+                    await self._async_close()
+            await self.client.connect()
+            self._active = True
+            self.generation += 1
+
+    async def async_failed(self) -> None:
+        """Drop a broken session."""
+        async with self._lock:
+            if self._active:
+                await self._async_close()
+
+    async def _async_close(self) -> None:
+        """Close the session, falling back to dropping the socket."""
+        self._active = False
+        self._operation_limits = {}
+        try:
+            await self.client.disconnect()
+        except Exception:  # pylint: disable=broad-except
+            self.client.disconnect_socket()
+
+    async def async_operation_limit(self, object_id: int, default: int) -> int:
+        """Return one Server.ServerCapabilities.OperationLimits value.
+
+        Servers that do not expose the limit or report 0 (no limit) get
+        default, and higher limits are capped at it, so a single request
+        never grows unbounded. The value is read once per session.
+        """
+        limit = self._operation_limits.get(object_id)
+        if limit is not None:
+            return limit
+        (result,) = await self.client.read_attributes(
+            [self.client.get_node(ua.NodeId(object_id))],
+            ua.AttributeIds.Value,
+        )
+        limit = result.Value.Value if result.StatusCode.is_good() else None
+        if limit:
+            _LOGGER.debug("%s OperationLimit %s = %s", self._url, object_id, limit)
+        limit = min(int(limit), default) if limit else default
+        self._operation_limits[object_id] = limit
+        return limit
+
+    async def async_read_values(
+        self, nodes: list[Node], index_ranges: list[str | None] | None = None
+    ) -> list[DataValue]:
+        """Read the Value DataValues of nodes, at most MaxNodesPerRead.
+
+        index_ranges, when given, holds the IndexRange of each node, None
+        reading the whole value. Reads submitted in the same event loop
+        turn, by any hub on this session, go out together in as few Read
+        requests as the limit allows. A private session reads directly.
+        """
+        if not self.shared:
+            async with self._read_semaphore:
+                return await self._async_read(nodes, index_ranges)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_reads.append((nodes, index_ranges, future))
+        if self._read_flush_task is None:
+            self._read_flush_task = asyncio.create_task(self._async_flush_reads())
+        return await future
+
+    async def _async_read(
+        self, nodes: list[Node], index_ranges: list[str | None] | None
+    ) -> list[DataValue]:
+        """Send one Read of the Value attribute of nodes."""
+        if not index_ranges or not any(index_ranges):
+            return await self.client.read_attributes(nodes, ua.AttributeIds.Value)
+        params = ua.ReadParameters()
+        params.NodesToRead = [
+            ua.ReadValueId(
+                NodeId=node.nodeid,
+                AttributeId=ua.AttributeIds.Value,
+                IndexRange=index_range,
+            )
+            for node, index_range in zip(nodes, index_ranges, strict=True)
+        ]
+        return await self.client.uaclient.read(params)
+
+    async def _async_flush_reads(self) -> None:
+        """Merge the pending reads into Read requests and send them."""
+        # Let every read of this event loop turn join the batch
+        await asyncio.sleep(0)
+        pending, self._pending_reads = self._pending_reads, []
+        self._read_flush_task = None
+        try:
+            limit = await self.async_operation_limit(
+                ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerRead,
+                DEFAULT_MAX_NODES_PER_READ,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            for _nodes, _index_ranges, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        batches: list[list[tuple[list[Node], Any, asyncio.Future]]] = []
+        size = 0
+        for read in pending:
+            if batches and size + len(read[0]) <= limit:
+                batches[-1].append(read)
+                size += len(read[0])
+            else:
+                batches.append([read])
+                size = len(read[0])
+        await asyncio.gather(*(self._async_read_batch(batch) for batch in batches))
+
+    async def _async_read_batch(
+        self, batch: list[tuple[list[Node], Any, asyncio.Future]]
+    ) -> None:
+        """Send one merged Read and hand each caller its slice."""
+        nodes = [node for read_nodes, _ranges, _future in batch for node in read_nodes]
+        index_ranges = None
+        if any(read_ranges for _nodes, read_ranges, _future in batch):
+            index_ranges = [
+                index_range
+                for read_nodes, read_ranges, _future in batch
+                for index_range in (read_ranges or [None] * len(read_nodes))
+            ]
+        try:
+            async with self._read_semaphore:
+                data_values = await self._async_read(nodes, index_ranges)
+        except Exception as e:  # pylint: disable=broad-except
+            for _nodes, _ranges, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        idx = 0
+        for read_nodes, _ranges, future in batch:
+            if not future.done():
+                future.set_result(data_values[idx : idx + len(read_nodes)])
+            idx += len(read_nodes)
+
+
 class OpcuaHub:
     """Hub that coordinate communicate to OPCUA server."""
 
@@ -236,6 +666,12 @@ class OpcuaHub:
         username: str | None = None,
         password: str | None = None,
         timeout: float = 4,
+        failover_urls: list[str] | None = None,
+        persistent_session: bool = True,
+        variant_type_cache_size: int | None = 4096,
+        read_concurrency: int = DEFAULT_READ_CONCURRENCY,
+        write_coalesce_window: float | None = None,
+        write_queue_depth: int = DEFAULT_WRITE_QUEUE_DEPTH,
     ) -> None:
         """Initialize the OPCUA hub."""
         self._hub_name = hub_name
@@ -244,28 +680,113 @@ class OpcuaHub:
         self._password = password
         self._timeout = timeout
         self._connected: bool = False
+        self._persistent_session = persistent_session
+        self._read_concurrency = read_concurrency
+
+        """Ordered endpoints, the first one preferred, with their health stats"""
+        self._endpoints: list[str] = [hub_url, *(failover_urls or [])]
+        self._endpoint_index = 0
+        self._endpoint_stats: list[dict[str, Any]] = [
+            {
+                "healthy": None,
+                "service_level": None,
+                "latency": None,
+                "checks": 0,
+                "failures": 0,
+            }
+            for _url in self._endpoints
+        ]
+        self._health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL
+        self._latency_preference: float = DEFAULT_LATENCY_PREFERENCE
+        self._health_task: asyncio.Task | None = None
+        self.failover_count: int = 0
+        """Endpoint of the last successful call, a failover lands elsewhere"""
+        self._connected_endpoint: int | None = None
+
+        """Session of each endpoint used, shared with hubs on the same endpoint"""
+        self._sessions: dict[int, OpcuaSession] = {}
+        self._session: OpcuaSession
+        self._session_released: bool = False
+        self._session_generation: int = 0
+        self._sync_lock = asyncio.Lock()
+        self._acquire_session()
+
+        """Connection state machine; one probe task reconnects while open"""
+        self._state = HubState.CONNECTED
+        self._consecutive_failures = 0
+        self._failure_threshold = DEFAULT_FAILURE_THRESHOLD
+        self._backoff_initial: float = DEFAULT_BACKOFF_INITIAL
+        self._backoff_max: float = DEFAULT_BACKOFF_MAX
+        self._probe_task: asyncio.Task | None = None
+
+        """Data change subscription, recreated whenever the session reopens"""
+        self._subscription: Any = None
+        self._subscription_callback: Callable[[list[str], Any], None] | None = None
+        self._publishing_interval: float = DEFAULT_PUBLISHING_INTERVAL
+        self._monitored_keys: dict[str, list[str]] = {}
+        self._monitored_filters: dict[str, tuple[ua.DeadbandType, float]] = {}
+        self._monitored_handles: dict[str, int] = {}
+        self._monitored_rejected: set[str] = set()
         self.device_info = DeviceInfo(
             configuration_url=hub_url,
             manufacturer=hub_manufacturer,
             model=hub_model,
         )
 
-        """Asyncua client"""
-        self.client: Client = Client(
-            url=hub_url,
-            timeout=5,
-        )
-        self.client.secure_channel_timeout = 60000  # 1 minute
-        self.client.session_timeout = 60000  # 1 minute
-        if self._username is not None:
-            self.client.set_user(username=self._username)
-        if self._password is not None:
-            self.client.set_password(pwd=self._password)
-
         self.packet_count: int = 0
         self.elapsed_time: float = 0
         self.cache_val: dict[str, Any] = {}
 
+        """StatusCode of each nodeid whose last read was bad"""
+        self.bad_nodes: dict[str, ua.StatusCode] = {}
+
+        """Outages (start, end) not backfilled yet, and the one in progress"""
+        self._outages: list[tuple[datetime, datetime]] = []
+        self._outage_started: datetime | None = None
+        self.history_supported: bool = True
+
+        """VariantType per node, least recently used entry evicted first"""
+        self._variant_types: OrderedDict[str, ua.VariantType] = OrderedDict()
+        self._variant_type_cache_size = variant_type_cache_size
+
+        """Parsed Node per NodeId string, so the poll loop never re-parses.
+
+        Nodes are bound to a client, so the index is dropped and node_epoch
+        bumped whenever the hub ends up on a different client.
+        """
+        self._nodes: dict[str, Node] = {}
+        self._nodes_client: Client = self._session.client
+        self.node_epoch: int = 0
+
+        """RegisterNodes aliases of the polled nodes, valid for one session"""
+        self._registered_nodes: dict[ua.NodeId, Node] = {}
+        self._registration_wanted: set[str] = set()
+        self._registration_supported: bool = True
+        self._alias_payloads: dict[Hashable, tuple[list[Node], list[Node]]] = {}
+
+        """Priority write lanes, drained by one worker task while not empty"""
+        self._write_coalesce_window = write_coalesce_window
+        self._write_queue_depth = write_queue_depth
+        self._write_lanes: dict[
+            WritePriority, deque[tuple[dict[str, Any], asyncio.Future, float]]
+        ] = {priority: deque() for priority in WritePriority}
+        self._write_worker: asyncio.Task | None = None
+        self._write_metrics: dict[WritePriority, dict[str, float]] = {
+            priority: {
+                "queued": 0,
+                "written": 0,
+                "failed": 0,
+                "rejected": 0,
+                "superseded": 0,
+                "max_wait": 0.0,
+            }
+            for priority in WritePriority
+        }
+
+        """Cleared while stop or interactive writes wait, pausing poll chunks"""
+        self._poll_gate = asyncio.Event()
+        self._poll_gate.set()
+
     @property
     def hub_name(self) -> str:
         """Return opcua hub name."""
@@ -273,8 +794,25 @@ class OpcuaHub:
 
     @property
     def hub_url(self) -> str:
-        """Return opcua hub url."""
-        return self._hub_url
+        """Return the url of the endpoint in use."""
+        return self._endpoints[self._endpoint_index]
+
+    @property
+    def endpoint_stats(self) -> list[dict[str, Any]]:
+        """Return health and health check latency (ms) of each endpoint."""
+        return [
+            {
+                "url": url,
+                "active": idx == self._endpoint_index,
+                **stats,
+                "latency": (
+                    None if stats["latency"] is None else stats["latency"] * 1000
+                ),
+            }
+            for idx, (url, stats) in enumerate(
+                zip(self._endpoints, self._endpoint_stats, strict=True)
+            )
+        ]
 
     @property
     def connected(self) -> bool:
@@ -286,6 +824,402 @@ class OpcuaHub:
         """Set connection status."""
         self._connected = val
 
+    @property
+    def state(self) -> HubState:
+        """Return the connection state of the hub."""
+        return self._state
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while calls fail fast and a probe reconnects."""
+        return self._state in (HubState.BACKING_OFF, HubState.OPEN_CIRCUIT)
+
+    @property
+    def write_metrics(self) -> dict[str, dict[str, float]]:
+        """Return counters, wait times and queue depth of each write lane."""
+        return {
+            priority.name.lower(): {
+                **metrics,
+                "depth": len(self._write_lanes[priority]),
+            }
+            for priority, metrics in self._write_metrics.items()
+        }
+
+    @property
+    def persistent_session(self) -> bool:
+        """Return True if the hub keeps one long-lived session open."""
+        return self._persistent_session
+
+    @property
+    def client(self) -> Client:
+        """Return the asyncua client of the hub session."""
+        return self._session.client
+
+    def _endpoint_session(self, idx: int) -> OpcuaSession:
+        """Return the session of an endpoint, acquiring it on first use.
+
+        Persistent hubs share the registry session of the endpoint; a hub
+        connecting per call owns a private one, as concurrent connects on a
+        shared client would close each other's sessions.
+        """
+        session = self._sessions.get(idx)
+        if session is None:
+            if self.persistent_session:
+                session = OpcuaSession.acquire(
+                    self._endpoints[idx],
+                    self._username,
+                    self._password,
+                    self._read_concurrency,
+                )
+            else:
+                session = OpcuaSession(
+                    self._endpoints[idx],
+                    self._username,
+                    self._password,
+                    self._read_concurrency,
+                )
+            self._sessions[idx] = session
+        return session
+
+    def _acquire_session(self) -> None:
+        """Attach the hub to the session of the endpoint in use."""
+        self._session = self._endpoint_session(self._endpoint_index)
+        self._session_released = False
+        self._session_generation = 0
+
+    def _check_client(self) -> None:
+        """Drop the Node index when the hub session has a different client."""
+        if self._session.client is self._nodes_client:
+            return
+        self._nodes = {}
+        self._alias_payloads = {}
+        self._nodes_client = self._session.client
+        self.node_epoch += 1
+
+    async def async_connect(self) -> None:
+        """Open the long-lived session, or reconnect if it has failed.
+
+        After the session was (re)opened, by this hub or another one sharing
+        it, the registrations and the subscription of this hub are redone.
+        """
+        if self._session_released:
+            self._acquire_session()
+        if self._health_task is None and self._health_checked:
+            self._health_task = asyncio.create_task(self._async_health_check())
+        self._check_client()
+        await self._session.async_connect()
+        if self._session_generation == self._session.generation:
+            return
+        async with self._sync_lock:
+            if self._session_generation == self._session.generation:
+                return
+            self._reset_session_state()
+            self._session_generation = self._session.generation
+            await self._async_sync_registered_nodes()
+            await self._async_sync_subscription()
+
+    async def async_disconnect(self) -> None:
+        """Leave the long-lived session and stop reconnecting.
+
+        The session is closed once no other hub shares it; otherwise only
+        the subscription and registrations of this hub are removed.
+        """
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self.persistent_session and not self._session_released:
+            if self._session.shared and self._session.active:
+                await self._async_drop_session_state()
+            self._session_released = True
+            sessions, self._sessions = self._sessions, {}
+            for session in sessions.values():
+                await session.async_release()
+        self._reset_session_state()
+        self._outages = []
+        self._outage_started = None
+        self.connected = False
+
+    @property
+    def _health_checked(self) -> bool:
+        """Return True if the endpoints are health checked in the background.
+
+        Checks need a session of their own on every endpoint, so they only
+        run for persistent hubs with standby endpoints.
+        """
+        return self.persistent_session and len(self._endpoints) > 1
+
+    async def _async_health_check(self) -> None:
+        """Check every endpoint periodically and move to the preferred one."""
+        try:
+            while True:
+                await asyncio.gather(
+                    *(
+                        self._async_check_endpoint(idx)
+                        for idx in range(len(self._endpoints))
+                    )
+                )
+                target = self._failover_target()
+                if target is not None and self._prefer_endpoint(target):
+                    await self._async_switch_endpoint(target)
+                    if self._probe_task is not None:
+                        # The standby answered, no need to wait for the backoff
+                        self._probe_task.cancel()
+                        self._consecutive_failures = 0
+                        self._set_state(HubState.DEGRADED)
+                await asyncio.sleep(self._health_check_interval)
+        finally:
+            self._health_task = None
+
+    async def _async_check_endpoint(self, idx: int) -> None:
+        """Read the ServiceLevel of an endpoint and time the round trip.
+
+        The latency is a moving average, so one slow answer does not move
+        the hub. A ServiceLevel of 0 (maintenance) or 1 (no data) marks a
+        redundant server that must not be used; servers that do not report
+        it count as healthy.
+        """
+        session = self._endpoint_session(idx)
+        stats = self._endpoint_stats[idx]
+        stats["checks"] += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(session.async_connect(), self._timeout)
+            (result,) = await asyncio.wait_for(
+                session.client.read_attributes(
+                    [session.client.get_node(ua.NodeId(ua.ObjectIds.Server_ServiceLevel))],
+                    ua.AttributeIds.Value,
+                ),
+                self._timeout,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            if stats["healthy"] is not False:
+                _LOGGER.warning(
+                    "Health check of %s @ %s failed: %s",
+                    self.hub_name,
+                    self._endpoints[idx],
+                    e,
+                )
+            stats["failures"] += 1
+            stats["healthy"] = False
+            if idx != self._endpoint_index:
+                await session.async_failed()
+            return
+        latency = time.perf_counter() - start
+        stats["latency"] = (
+            latency
+            if stats["latency"] is None
+            else 0.8 * stats["latency"] + 0.2 * latency
+        )
+        level = result.Value.Value if result.StatusCode.is_good() else None
+        stats["service_level"] = level
+        stats["healthy"] = level is None or level > 1
+
+    def _failover_target(self) -> int | None:
+        """Return the healthy standby endpoint with the lowest latency."""
+        candidates = [
+            idx
+            for idx, stats in enumerate(self._endpoint_stats)
+            if idx != self._endpoint_index and stats["healthy"]
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda idx: (
+                self._endpoint_stats[idx]["latency"] or math.inf,
+                idx,
+            ),
+        )
+
+    def _prefer_endpoint(self, target: int) -> bool:
+        """Return True if the hub should move from its endpoint to target.
+
+        A healthy endpoint is only left for one clearly faster, so two
+        endpoints with similar latency do not make the hub flap.
+        """
+        active = self._endpoint_stats[self._endpoint_index]
+        if not active["healthy"]:
+            return True
+        latency = self._endpoint_stats[target]["latency"]
+        return (
+            latency is not None
+            and active["latency"] is not None
+            and latency < active["latency"] * self._latency_preference
+        )
+
+    async def _async_switch_endpoint(self, idx: int) -> None:
+        """Move the hub to another endpoint.
+
+        The subscription and registrations are removed from a healthy old
+        endpoint, a broken session is dropped. The next call reconnects on
+        the new endpoint, registers the nodes and recreates the
+        subscription there, and the Node index is rebuilt for its client.
+        The failover itself is counted and logged by _call_succeeded, once
+        a call succeeds on the new endpoint, so rotating through endpoints
+        that are all down stays quiet.
+        """
+        old_url = self.hub_url
+        if self.persistent_session and self._session.active:
+            if self._endpoint_stats[self._endpoint_index]["healthy"]:
+                await self._async_drop_session_state()
+            else:
+                await self._session.async_failed()
+        self._endpoint_index = idx
+        self._acquire_session()
+        self._reset_session_state()
+        self.connected = False
+        _LOGGER.debug("%s moving from %s to %s", self.hub_name, old_url, self.hub_url)
+
+    async def _async_drop_session_state(self) -> None:
+        """Delete the subscription and registrations of this hub."""
+        try:
+            if self._subscription is not None:
+                await self._subscription.delete()
+            if self._registered_nodes:
+                await self.client.unregister_nodes(list(self._registered_nodes.values()))
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to clean up %s on its session: %s", self.hub_name, e)
+
+    def _reset_session_state(self) -> None:
+        """Forget everything that only lives as long as one session."""
+        self._subscription = None
+        self._monitored_handles = {}
+        self._monitored_rejected = set()
+        self._registered_nodes = {}
+        self._alias_payloads = {}
+
+    async def _async_session_failed(self) -> None:
+        """Mark the hub disconnected and drop a broken long-lived session."""
+        self.connected = False
+        if self.persistent_session:
+            await self._session.async_failed()
+
+    def _set_state(self, state: HubState) -> None:
+        """Move the state machine, logging each transition once."""
+        if state == self._state:
+            return
+        _LOGGER.debug("%s @ %s: %s -> %s", self.hub_name, self.hub_url, self._state, state)
+        if state == HubState.CONNECTED:
+            _LOGGER.warning("Connection to %s @ %s restored", self.hub_name, self.hub_url)
+        elif state == HubState.BACKING_OFF:
+            _LOGGER.error(
+                "%s @ %s unreachable after %s attempts, reconnecting in the background",
+                self.hub_name,
+                self.hub_url,
+                self._consecutive_failures,
+            )
+        self._state = state
+
+    def _call_succeeded(self) -> None:
+        """Record a successful call, closing the outage in progress.
+
+        A call succeeding on another endpoint than the last one completes
+        a failover.
+        """
+        if (
+            self._connected_endpoint is not None
+            and self._connected_endpoint != self._endpoint_index
+        ):
+            self.failover_count += 1
+            _LOGGER.warning(
+                "%s switched from %s to %s",
+                self.hub_name,
+                self._endpoints[self._connected_endpoint],
+                self.hub_url,
+            )
+        self._connected_endpoint = self._endpoint_index
+        if self._outage_started is not None:
+            self._outages.append((self._outage_started, dt_util.utcnow()))
+            self._outage_started = None
+        self._consecutive_failures = 0
+        self.connected = True
+        self._set_state(HubState.CONNECTED)
+
+    async def _async_call_failed(self, message: str, error: Exception) -> None:
+        """Record a failed call and open the circuit after too many in a row.
+
+        Only the first failure after a healthy period is logged as a
+        warning, the following ones at debug level.
+        """
+        self._consecutive_failures += 1
+        if self._outage_started is None:
+            self._outage_started = dt_util.utcnow()
+        level = logging.WARNING if self._state == HubState.CONNECTED else logging.DEBUG
+        _LOGGER.log(level, message, self.hub_name, self.hub_url, error)
+        await self._async_session_failed()
+        if self.circuit_open:
+            return
+        if self._consecutive_failures < self._failure_threshold:
+            self._set_state(HubState.DEGRADED)
+            return
+        target = self._failover_target()
+        if target is not None:
+            self._endpoint_stats[self._endpoint_index]["healthy"] = False
+            await self._async_switch_endpoint(target)
+            self._consecutive_failures = 0
+            self._set_state(HubState.DEGRADED)
+            return
+        self._set_state(HubState.BACKING_OFF)
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._async_probe())
+
+    async def _async_probe(self) -> None:
+        """Reconnect with jittered exponential backoff until it succeeds."""
+        delay = self._backoff_initial
+        try:
+            while True:
+                await asyncio.sleep(delay * random.uniform(0.5, 1))
+                try:
+                    await self._async_probe_connection()
+                except Exception as e:  # pylint: disable=broad-except
+                    _LOGGER.debug(
+                        "Probe of %s @ %s failed: %s", self.hub_name, self.hub_url, e
+                    )
+                    await self._async_session_failed()
+                    if len(self._endpoints) > 1:
+                        await self._async_switch_endpoint(
+                            self._next_endpoint()
+                        )
+                    delay = min(delay * 2, self._backoff_max)
+                    if delay >= self._backoff_max:
+                        self._set_state(HubState.OPEN_CIRCUIT)
+                    continue
+                self._call_succeeded()
+                return
+        finally:
+            self._probe_task = None
+
+    def _next_endpoint(self) -> int:
+        """Return the endpoint to probe next: a healthy one, else the next in order."""
+        target = self._failover_target()
+        if target is None:
+            target = (self._endpoint_index + 1) % len(self._endpoints)
+        return target
+
+    async def _async_probe_connection(self) -> None:
+        """Open a session to check that the server is reachable again."""
+        if self.persistent_session:
+            await self.async_connect()
+        else:
+            async with self.client:
+                pass
+
+    def get_node(self, nodeid: str) -> Node:
+        """Return the Node of a NodeId string, parsing it only once."""
+        if self._session.client is not self._nodes_client:
+            self._check_client()
+        node = self._nodes.get(nodeid)
+        if node is None:
+            node = self._nodes[nodeid] = self.client.get_node(nodeid=nodeid)
+        return node
+
+    def resolve_nodes(self, nodeids: Iterable[str]) -> list[Node]:
+        """Return the Nodes of NodeId strings, adding new ones to the index."""
+        return [self.get_node(nodeid) for nodeid in nodeids]
+
     @staticmethod
     def asyncua_wrapper(
         func: Callable[..., Any],
@@ -295,37 +1229,42 @@ class OpcuaHub:
         @functools.wraps(func)
         async def get_set_wrapper(self, *args: Any, **kwargs: Any) -> Any:
             data = {}
+            if self.circuit_open:
+                # Fail fast, the probe task is reconnecting
+                return data
             try:
                 start_time = time.perf_counter()
-                async with self.client:
+                if self.persistent_session:
+                    await self.async_connect()
                     data = await func(self, *args, **kwargs)
-                    self.packet_count += 1
-                    self.elapsed_time = time.perf_counter() - start_time
-                    self.connected = True
+                else:
+                    async with self.client:
+                        data = await func(self, *args, **kwargs)
+                self.packet_count += 1
+                self.elapsed_time = time.perf_counter() - start_time
+                self._call_succeeded()
             except RuntimeError as e:
-                _LOGGER.error(
-                    "RuntimeError while connecting to %s @ %s: %s",
-                    self.hub_name,
-                    self.hub_url,
-                    e,
+                await self._async_call_failed(
+                    "RuntimeError while connecting to %s @ %s: %s", e
                 )
-                self.connected = False
             except TimeoutError as e:
-                _LOGGER.error(
-                    "Timeout while connecting to %s @ %s: %s",
-                    self.hub_name,
-                    self.hub_url,
-                    e,
+                await self._async_call_failed(
+                    "Timeout while connecting to %s @ %s: %s", e
                 )
-                self.connected = False
             except ConnectionRefusedError as e:
-                _LOGGER.error(
-                    "Connection Refused Error while connecting to %s @ %s: %s",
-                    self.hub_name,
-                    self.hub_url,
-                    e,
+                await self._async_call_failed(
+                    "Connection Refused Error while connecting to %s @ %s: %s", e
+                )
+            except ConnectionError as e:
+                await self._async_call_failed(
+                    "Connection lost to %s @ %s: %s", e
+                )
+            except ua.UaStatusCodeError as e:
+                if e.code not in SESSION_STATUS_CODES:
+                    raise
+                await self._async_call_failed(
+                    "Session closed by %s @ %s: %s", e
                 )
-                self.connected = False
             return data
 
         return get_set_wrapper
@@ -333,35 +1272,707 @@ class OpcuaHub:
     @asyncua_wrapper
     async def get_value(self, nodeid: str) -> Any:
         """Get node value and return value."""
-        node = self.client.get_node(nodeid=nodeid)
+        node = self.get_node(nodeid)
+        node = self._registered_nodes.get(node.nodeid, node)
         return await node.read_value()
 
     @asyncua_wrapper
-    async def get_values(self, node_key_pair: dict[str, str]) -> dict | None:
-        """Get multiple node values and return value in zip dictionary format."""
+    async def get_values(
+        self,
+        node_key_pair: dict[str, str],
+        nodes: list[Node] | None = None,
+        index_ranges: dict[str, str] | None = None,
+        payload_key: Hashable | None = None,
+    ) -> dict | None:
+        """Get multiple node values and return value in zip dictionary format.
+
+        nodes, when given, are the already resolved Nodes of node_key_pair in
+        the same order and are reused as the read request payload; a payload
+        reused every cycle is named by payload_key, so its aliased request
+        is cached under that key. Nodes in
+        index_ranges are array nodes, read only over their IndexRange. Nodes
+        the server answers with a bad StatusCode are left out of the result
+        and kept in bad_nodes until they read good again.
+        """
         if not (node_key_pair):
             return {}
-        nodes = [
-            self.client.get_node(nodeid=nodeid) for key, nodeid in node_key_pair.items()
-        ]
-        vals = await self.client.read_values(nodes=nodes)
-        self.cache_val = dict(zip(node_key_pair.keys(), vals, strict=True))
-        return self.cache_val
+        if nodes is None:
+            nodes = self.resolve_nodes(node_key_pair.values())
+        ranges = None
+        if index_ranges:
+            ranges = [index_ranges.get(nodeid) for nodeid in node_key_pair.values()]
+        data_values = await self._async_read_values(
+            nodes=self._read_request_nodes(nodes, payload_key),
+            index_ranges=ranges,
+        )
+        vals = {}
+        for (key, nodeid), data_value in zip(
+            node_key_pair.items(), data_values, strict=True
+        ):
+            status = data_value.StatusCode
+            if status.is_bad():
+                if nodeid not in self.bad_nodes:
+                    _LOGGER.warning(
+                        "Bad value for %s (%s) on %s: %s",
+                        key,
+                        nodeid,
+                        self.hub_name,
+                        status,
+                    )
+                self.bad_nodes[nodeid] = status
+                continue
+            self.bad_nodes.pop(nodeid, None)
+            vals[key] = data_value.Value.Value
+        self.cache_val.update(vals)
+        return vals
+
+    def _read_request_nodes(
+        self, nodes: list[Node], payload_key: Hashable | None = None
+    ) -> list[Node]:
+        """Substitute registered aliases into a read payload.
+
+        The substituted list of a payload named by payload_key is cached
+        until the registrations change, so a payload reused every cycle is
+        mapped only once. A newer payload under the same key replaces it;
+        one-off payloads are not cached.
+        """
+        if not self._registered_nodes:
+            return nodes
+        cached = self._alias_payloads.get(payload_key)
+        if cached is not None and cached[0] is nodes:
+            return cached[1]
+        aliases = [self._registered_nodes.get(node.nodeid, node) for node in nodes]
+        if payload_key is not None:
+            self._alias_payloads[payload_key] = (nodes, aliases)
+        return aliases
+
+    async def register_nodes(self, nodeids: Iterable[str]) -> bool:
+        """Register the nodes read every cycle and unregister all others.
+
+        Registration is kept for the lifetime of the session and redone
+        after every reconnect. The wanted nodes are recorded first, so a
+        call failing on the connection is made up for by the reconnect.
+        Returns True once the server side is in line.
+        """
+        self._registration_wanted = set(nodeids)
+        return bool(await self._async_register_nodes())
 
     @asyncua_wrapper
-    async def set_value(self, nodeid: str, value: Any) -> bool:
-        """Get node variant type automatically and set the value."""
-        node = self.client.get_node(nodeid=nodeid)
-        node_type = await node.read_data_type_as_variant_type()
-        var = ua.Variant(
-            ua_utils.string_to_variant(
-                string=str(value),
-                vtype=node_type,
+    async def _async_register_nodes(self) -> bool:
+        """Bring the registrations in line within a managed call."""
+        await self._async_sync_registered_nodes()
+        return True
+
+    async def _async_sync_registered_nodes(self) -> None:
+        """Bring the server-side registrations in line with the wanted nodes."""
+        if not self.persistent_session or not self._registration_supported:
+            return
+        wanted = {self.get_node(nodeid).nodeid for nodeid in self._registration_wanted}
+        stale = [nodeid for nodeid in self._registered_nodes if nodeid not in wanted]
+        missing = [nodeid for nodeid in wanted if nodeid not in self._registered_nodes]
+        if not stale and not missing:
+            return
+        limit = await self._session.async_operation_limit(
+            ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerRegisterNodes,
+            DEFAULT_MAX_NODES_PER_READ,
+        )
+        self._alias_payloads = {}
+        try:
+            if stale:
+                aliases = [self._registered_nodes.pop(nodeid) for nodeid in stale]
+                for idx in range(0, len(aliases), limit):
+                    await self.client.unregister_nodes(aliases[idx : idx + limit])
+            for idx in range(0, len(missing), limit):
+                chunk = missing[idx : idx + limit]
+                # register_nodes rewrites the nodeid of the Nodes it is given,
+                # so hand it fresh Nodes instead of the shared index entries
+                aliases = await self.client.register_nodes(
+                    [self.client.get_node(nodeid) for nodeid in chunk]
+                )
+                self._registered_nodes.update(zip(chunk, aliases, strict=True))
+        except ua.UaStatusCodeError as e:
+            if e.code in SESSION_STATUS_CODES:
+                raise
+            _LOGGER.warning(
+                "RegisterNodes not usable on %s @ %s, reading unregistered: %s",
+                self.hub_name,
+                self.hub_url,
+                e,
             )
+            self._registration_supported = False
+            self._registered_nodes = {}
+
+    async def _async_read_values(
+        self, nodes: list, index_ranges: list[str | None] | None = None
+    ) -> list[DataValue]:
+        """Read the Value DataValues of nodes in chunks of MaxNodesPerRead.
+
+        Each node keeps its own StatusCode, so one bad node does not fail
+        the whole read.
+
+        Chunks are sent concurrently over the session, at most
+        read_concurrency requests in flight, and merged with the reads of
+        other hubs sharing it. A chunk not yet sent waits while stop or
+        interactive writes are queued.
+        """
+        limit = await self._async_max_nodes_per_read()
+        if len(nodes) <= limit:
+            await self._poll_gate.wait()
+            return await self._session.async_read_values(nodes, index_ranges)
+
+        async def _read_chunk(idx: int) -> list:
+            await self._poll_gate.wait()
+            return await self._session.async_read_values(
+                nodes[idx : idx + limit],
+                index_ranges[idx : idx + limit] if index_ranges else None,
+            )
+
+        chunks = await asyncio.gather(
+            *(_read_chunk(idx) for idx in range(0, len(nodes), limit))
+        )
+        return [val for chunk in chunks for val in chunk]
+
+    async def _async_max_nodes_per_read(self) -> int:
+        """Return the server MaxNodesPerRead, probing it on first use."""
+        return await self._session.async_operation_limit(
+            ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerRead,
+            DEFAULT_MAX_NODES_PER_READ,
         )
-        await node.write_value(DataValue(var))
+
+    async def set_value(
+        self,
+        nodeid: str,
+        value: Any,
+        priority: WritePriority = WritePriority.INTERACTIVE,
+    ) -> bool:
+        """Write one node value and return True if the server accepted it."""
+        results = await self.set_values({nodeid: value}, priority=priority)
+        return results.get(nodeid, False)
+
+    async def set_values(
+        self,
+        values: dict[str, Any],
+        priority: WritePriority = WritePriority.INTERACTIVE,
+    ) -> dict[str, bool]:
+        """Queue writes in a priority lane and return whether each succeeded.
+
+        Lanes are drained highest priority first, every write waiting in a
+        lane going out in one Write request. Stop writes are always accepted;
+        the other lanes reject new writes once write_queue_depth are waiting.
+        A write supersedes the writes to the same nodes still waiting in its
+        own or a lower priority lane, whose callers get False for them.
+        """
+        if not values:
+            return {}
+        lane = self._write_lanes[priority]
+        metrics = self._write_metrics[priority]
+        if priority != WritePriority.STOP and len(lane) >= self._write_queue_depth:
+            metrics["rejected"] += 1
+            _LOGGER.warning(
+                "Write queue %s of %s is full, rejecting write to %s",
+                priority.name.lower(),
+                self.hub_name,
+                ", ".join(values),
+            )
+            return {nodeid: False for nodeid in values}
+        self._supersede_writes(priority, values)
+        future = asyncio.get_running_loop().create_future()
+        lane.append((dict(values), future, time.monotonic()))
+        metrics["queued"] += 1
+        if priority != WritePriority.BACKGROUND:
+            self._poll_gate.clear()
+        if self._write_worker is None:
+            self._write_worker = asyncio.create_task(self._async_drain_writes())
+        return await asyncio.shield(future)
+
+    def _supersede_writes(self, priority: WritePriority, values: dict[str, Any]) -> None:
+        """Drop the waiting writes to nodes of values that would land after it.
+
+        A stop jumps the interactive and background lanes, so an earlier
+        open or on still waiting there would undo it. Within a lane only
+        the last value of a node would be written. Writes left with no node
+        are resolved right away.
+        """
+        for lane_priority in WritePriority:
+            if lane_priority < priority:
+                continue
+            lane = self._write_lanes[lane_priority]
+            for entry in list(lane):
+                pending, future, _queued = entry
+                superseded = [
+                    nodeid
+                    for nodeid, value in pending.items()
+                    if nodeid in values and value is not _SUPERSEDED
+                ]
+                if not superseded:
+                    continue
+                for nodeid in superseded:
+                    pending[nodeid] = _SUPERSEDED
+                self._write_metrics[lane_priority]["superseded"] += 1
+                if all(value is _SUPERSEDED for value in pending.values()):
+                    lane.remove(entry)
+                    if not future.done():
+                        future.set_result({nodeid: False for nodeid in pending})
+
+    def _next_write_lane(self) -> WritePriority | None:
+        """Return the highest priority lane with writes waiting."""
+        for priority in WritePriority:
+            if self._write_lanes[priority]:
+                return priority
+        return None
+
+    async def _async_drain_writes(self) -> None:
+        """Send queued writes until every lane is empty.
+
+        Each round merges every write waiting in the highest priority lane
+        into one Write. With a coalescing window, a round of a non-stop lane
+        first waits out the window to collect more writes.
+        """
+        try:
+            while (priority := self._next_write_lane()) is not None:
+                if (
+                    priority != WritePriority.STOP
+                    and self._write_coalesce_window is not None
+                ):
+                    await asyncio.sleep(self._write_coalesce_window)
+                    priority = self._next_write_lane()
+                lane = self._write_lanes[priority]
+                batch = list(lane)
+                lane.clear()
+                values: dict[str, Any] = {}
+                for pending, _future, _queued in batch:
+                    values.update(
+                        (nodeid, value)
+                        for nodeid, value in pending.items()
+                        if value is not _SUPERSEDED
+                    )
+                try:
+                    results = await self._async_set_values(values)
+                    error = None
+                except Exception as e:  # pylint: disable=broad-except
+                    results = {}
+                    error = e
+                self._finish_writes(priority, batch, results, error)
+                if not (
+                    self._write_lanes[WritePriority.STOP]
+                    or self._write_lanes[WritePriority.INTERACTIVE]
+                ):
+                    self._poll_gate.set()
+        finally:
+            self._write_worker = None
+            self._poll_gate.set()
+
+    def _finish_writes(
+        self,
+        priority: WritePriority,
+        batch: list[tuple[dict[str, Any], asyncio.Future, float]],
+        results: dict[str, bool],
+        error: Exception | None,
+    ) -> None:
+        """Resolve the callers of a sent batch and record lane metrics."""
+        metrics = self._write_metrics[priority]
+        now = time.monotonic()
+        for pending, future, queued in batch:
+            metrics["max_wait"] = max(metrics["max_wait"], now - queued)
+            result = {
+                nodeid: value is not _SUPERSEDED and results.get(nodeid, False)
+                for nodeid, value in pending.items()
+            }
+            written = all(
+                result[nodeid]
+                for nodeid, value in pending.items()
+                if value is not _SUPERSEDED
+            )
+            metrics["written" if error is None and written else "failed"] += 1
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    @asyncua_wrapper
+    async def _async_set_values(self, values: dict[str, Any]) -> dict[str, bool]:
+        """Write several node values with a single Write request.
+
+        Returns whether each node was written. Missing variant types are
+        read in one batch first; nodes answering BadTypeMismatch have their
+        cached type dropped, read again and are written once more.
+        """
+        results = await self._async_write_values(values)
+        retry = {
+            nodeid: values[nodeid]
+            for nodeid, status in results.items()
+            if status.value == ua.StatusCodes.BadTypeMismatch
+        }
+        for nodeid in retry:
+            self.invalidate_variant_type(nodeid)
+        if retry:
+            results.update(await self._async_write_values(retry))
+        for nodeid, status in results.items():
+            if not status.is_good():
+                _LOGGER.error(
+                    "Unable to write %s on %s: %s", nodeid, self.hub_name, status
+                )
+        return {nodeid: status.is_good() for nodeid, status in results.items()}
+
+    async def _async_write_values(
+        self, values: dict[str, Any]
+    ) -> dict[str, ua.StatusCode]:
+        """Write values using the cached variant types, chunked by MaxNodesPerWrite."""
+        await self._async_load_variant_types(values)
+        results: dict[str, ua.StatusCode] = {}
+        writable: dict[str, DataValue] = {}
+        for nodeid, value in values.items():
+            node_type = self._variant_types.get(nodeid)
+            if node_type is None:
+                results[nodeid] = ua.StatusCode(ua.StatusCodes.BadTypeMismatch)
+                continue
+            self._variant_types.move_to_end(nodeid)
+            writable[nodeid] = DataValue(
+                ua.Variant(
+                    ua_utils.string_to_variant(
+                        string=str(value),
+                        vtype=node_type,
+                    )
+                )
+            )
+        limit = await self._session.async_operation_limit(
+            ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerWrite,
+            DEFAULT_MAX_NODES_PER_READ,
+        )
+        nodeids = list(writable)
+        for idx in range(0, len(nodeids), limit):
+            chunk = nodeids[idx : idx + limit]
+            statuses = await self.client.write_values(
+                self.resolve_nodes(chunk),
+                [writable[nodeid] for nodeid in chunk],
+                raise_on_partial_error=False,
+            )
+            results.update(zip(chunk, statuses, strict=True))
+        return results
+
+    def _cache_variant_type(self, nodeid: str, node_type: ua.VariantType) -> None:
+        """Store the variant type of a node, evicting the oldest if full."""
+        self._variant_types[nodeid] = node_type
+        self._variant_types.move_to_end(nodeid)
+        if (
+            self._variant_type_cache_size is not None
+            and len(self._variant_types) > self._variant_type_cache_size
+        ):
+            self._variant_types.popitem(last=False)
+
+    def invalidate_variant_type(self, nodeid: str | None = None) -> None:
+        """Forget the cached variant type of a node, or of all nodes."""
+        if nodeid is None:
+            self._variant_types.clear()
+        else:
+            self._variant_types.pop(nodeid, None)
+
+    @asyncua_wrapper
+    async def prefetch_variant_types(self, nodeids: Iterable[str]) -> bool:
+        """Fill the variant type cache with one batched Read of DataType."""
+        await self._async_load_variant_types(nodeids)
         return True
 
+    async def _async_load_variant_types(self, nodeids: Iterable[str]) -> None:
+        """Read the variant types missing from the cache in one batch."""
+        missing = list(
+            dict.fromkeys(
+                nodeid for nodeid in nodeids if nodeid and nodeid not in self._variant_types
+            )
+        )
+        if not missing:
+            return
+        data_types = await self.client.read_attributes(
+            self.resolve_nodes(missing),
+            ua.AttributeIds.DataType,
+        )
+        for nodeid, data_type in zip(missing, data_types, strict=True):
+            if not data_type.StatusCode.is_good():
+                _LOGGER.debug(
+                    "Unable to read data type of %s on %s: %s",
+                    nodeid,
+                    self.hub_name,
+                    data_type.StatusCode,
+                )
+                continue
+            node_type = await ua_utils.data_type_to_variant_type(
+                self.client.get_node(data_type.Value.Value)
+            )
+            self._cache_variant_type(nodeid, node_type)
+
+    @asyncua_wrapper
+    async def subscribe(
+        self,
+        node_key_pair: dict[str, str],
+        on_change: Callable[[list[str], Any], None],
+        publishing_interval: float = DEFAULT_PUBLISHING_INTERVAL,
+        deadbands: dict[str, tuple[ua.DeadbandType, float]] | None = None,
+    ) -> bool:
+        """Monitor every node in node_key_pair and report its data changes.
+
+        on_change receives the keys mapped to the changed node and the new
+        value. Calling it again only adds or removes the monitored items that
+        differ, and the subscription is recreated after every reconnect.
+        Nodes in deadbands are monitored with a DataChangeFilter so changes
+        inside the deadband are dropped by the server. NodeIds are expected
+        in canonical form (normalize_nodeid), as the coordinator stores them,
+        so they match the NodeIds of the notifications without parsing them
+        again on every call.
+        """
+        monitored_keys: dict[str, list[str]] = {}
+        for key, nodeid in node_key_pair.items():
+            monitored_keys.setdefault(nodeid, []).append(key)
+        self._monitored_keys = monitored_keys
+        self._monitored_filters = dict(deadbands or {})
+        self._subscription_callback = on_change
+        self._publishing_interval = publishing_interval
+        await self._async_sync_subscription()
+        return True
+
+    async def _async_sync_subscription(self) -> None:
+        """Bring the monitored items of the subscription in line with the nodes."""
+        if self._subscription_callback is None or not self.persistent_session:
+            return
+        if self._subscription is None:
+            self._subscription = await self.client.create_subscription(
+                self._publishing_interval, _DataChangeHandler(self)
+            )
+            self._monitored_handles = {}
+        stale = [
+            nodeid
+            for nodeid in self._monitored_handles
+            if nodeid not in self._monitored_keys
+        ]
+        if stale:
+            await self._subscription.unsubscribe(
+                [self._monitored_handles.pop(nodeid) for nodeid in stale]
+            )
+        missing = [
+            nodeid
+            for nodeid in self._monitored_keys
+            if nodeid not in self._monitored_handles
+            and nodeid not in self._monitored_rejected
+        ]
+        filter_groups: dict[tuple[ua.DeadbandType, float] | None, list[str]] = {}
+        for nodeid in missing:
+            filter_groups.setdefault(self._monitored_filters.get(nodeid), []).append(
+                nodeid
+            )
+        for deadband, nodeids in filter_groups.items():
+            await self._async_monitor_nodes(nodeids, deadband)
+
+    async def _async_monitor_nodes(
+        self,
+        nodeids: list[str],
+        deadband: tuple[ua.DeadbandType, float] | None,
+    ) -> None:
+        """Create monitored items, falling back to no filter if refused."""
+        nodes = self.resolve_nodes(nodeids)
+        if deadband is None:
+            handles = await self._subscription.subscribe_data_change(
+                nodes, queuesize=1
+            )
+        else:
+            deadband_type, deadband_value = deadband
+            handles = await self._subscription.deadband_monitor(
+                nodes, deadband_value, deadband_type.value, queuesize=1
+            )
+        refused: list[str] = []
+        for nodeid, handle in zip(nodeids, handles, strict=True):
+            if isinstance(handle, ua.StatusCode):
+                refused.append(nodeid)
+                _LOGGER.warning(
+                    "Unable to monitor %s on %s%s: %s",
+                    nodeid,
+                    self.hub_name,
+                    "" if deadband is None else " with deadband",
+                    handle,
+                )
+                continue
+            self._monitored_handles[nodeid] = handle
+        if not refused:
+            return
+        if deadband is not None:
+            # The deadband is still applied by the coordinator
+            await self._async_monitor_nodes(refused, None)
+            return
+        self._monitored_rejected.update(refused)
+
+    def handle_data_change(self, nodeid: str, value: Any) -> None:
+        """Dispatch a data change notification to the keys of the node."""
+        keys = self._monitored_keys.get(nodeid)
+        if not keys or self._subscription_callback is None:
+            return
+        for key in keys:
+            self.cache_val[key] = value
+        self._subscription_callback(keys, value)
+
+    def pop_outages(self) -> list[tuple[datetime, datetime]]:
+        """Return the outages closed since the last call and forget them."""
+        outages, self._outages = self._outages, []
+        return outages
+
+    async def async_read_history(
+        self,
+        nodeids: Iterable[str],
+        start: datetime,
+        end: datetime,
+        page_size: int = DEFAULT_HISTORY_PAGE_SIZE,
+    ) -> AsyncIterator[dict[str, list[DataValue]]]:
+        """Yield the raw history of nodes between start and end, page by page.
+
+        A generator cannot run under asyncua_wrapper, so the same rules are
+        applied here: nothing is sent while the circuit is open, and
+        connection and session failures count towards the backoff and
+        failover of the hub. Both raise ConnectionError to the caller.
+        """
+        if self.circuit_open:
+            raise ConnectionError(
+                f"{self.hub_name} @ {self.hub_url} is unreachable ({self.state})"
+            )
+        try:
+            async for page in self._async_read_history_pages(
+                nodeids, start, end, page_size
+            ):
+                yield page
+        except (RuntimeError, TimeoutError, ConnectionError) as e:
+            await self._async_call_failed("History read from %s @ %s failed: %s", e)
+            raise ConnectionError(str(e)) from e
+        except ua.UaStatusCodeError as e:
+            if e.code not in SESSION_STATUS_CODES:
+                raise
+            await self._async_call_failed("Session closed by %s @ %s: %s", e)
+            raise ConnectionError(str(e)) from e
+        self._call_succeeded()
+
+    async def _async_read_history_pages(
+        self,
+        nodeids: Iterable[str],
+        start: datetime,
+        end: datetime,
+        page_size: int,
+    ) -> AsyncIterator[dict[str, list[DataValue]]]:
+        """Yield the raw history of nodes between start and end, page by page.
+
+        Nodes are read together, up to MaxNodesPerHistoryReadData per
+        HistoryRead, at most page_size values per node and request; the
+        continuation points of the nodes with more values are sent back
+        until all are exhausted. Only one page is held at a time. The
+        bounding values at start are returned too, so the value held when
+        the window opens is known.
+
+        Nodes without history are left out. A server without the service
+        clears history_supported and yields nothing.
+        """
+        await self.async_connect()
+        nodeids = list(dict.fromkeys(nodeids))
+        limit = await self._session.async_operation_limit(
+            ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerHistoryReadData,
+            DEFAULT_MAX_NODES_PER_READ,
+        )
+        details = ua.ReadRawModifiedDetails(
+            IsReadModified=False,
+            StartTime=start,
+            EndTime=end,
+            NumValuesPerNode=page_size,
+            ReturnBounds=True,
+        )
+        for idx in range(0, len(nodeids), limit):
+            pending: dict[str, bytes | None] = dict.fromkeys(nodeids[idx : idx + limit])
+            try:
+                while pending:
+                    results = await self._async_history_read(details, pending)
+                    if results is None:
+                        return
+                    page: dict[str, list[DataValue]] = {}
+                    for nodeid, result in zip(list(pending), results, strict=True):
+                        if result.StatusCode.is_bad():
+                            _LOGGER.log(
+                                logging.DEBUG
+                                if result.StatusCode.value in HISTORY_UNSUPPORTED_CODES
+                                else logging.WARNING,
+                                "No history for %s on %s: %s",
+                                nodeid,
+                                self.hub_name,
+                                result.StatusCode,
+                            )
+                            del pending[nodeid]
+                            continue
+                        history = result.HistoryData
+                        page[nodeid] = (history.DataValues if history else None) or []
+                        if result.ContinuationPoint:
+                            pending[nodeid] = result.ContinuationPoint
+                        else:
+                            del pending[nodeid]
+                    yield page
+            finally:
+                if any(pending.values()):
+                    await self._async_release_continuation_points(details, pending)
+
+    async def _async_history_read(
+        self,
+        details: ua.ReadRawModifiedDetails,
+        continuation_points: dict[str, bytes | None],
+        release: bool = False,
+    ) -> list[ua.HistoryReadResult] | None:
+        """Send one HistoryRead, None when the server keeps no history."""
+        params = ua.HistoryReadParameters()
+        params.HistoryReadDetails = details
+        params.TimestampsToReturn = ua.TimestampsToReturn.Source
+        params.ReleaseContinuationPoints = release
+        params.NodesToRead = [
+            ua.HistoryReadValueId(
+                NodeId=self.get_node(nodeid).nodeid,
+                ContinuationPoint=continuation_point,
+            )
+            for nodeid, continuation_point in continuation_points.items()
+        ]
+        try:
+            return await self.client.uaclient.history_read(params)
+        except ua.UaStatusCodeError as e:
+            if e.code not in HISTORY_UNSUPPORTED_CODES:
+                raise
+            _LOGGER.info("%s keeps no history, outages are not backfilled: %s", self.hub_name, e)
+            self.history_supported = False
+            return None
+
+    async def _async_release_continuation_points(
+        self,
+        details: ua.ReadRawModifiedDetails,
+        continuation_points: dict[str, bytes | None],
+    ) -> None:
+        """Free the continuation points of a read stopped before its end."""
+        try:
+            await self._async_history_read(
+                details,
+                {
+                    nodeid: point
+                    for nodeid, point in continuation_points.items()
+                    if point
+                },
+                release=True,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to release continuation points on %s: %s", self.hub_name, e)
+
+    @asyncua_wrapper
+    async def get_eu_ranges(self, nodeids: Iterable[str]) -> dict[str, float]:
+        """Return the EURange span (High - Low) of nodes that expose one."""
+        spans: dict[str, float] = {}
+        for nodeid in dict.fromkeys(nodeids):
+            try:
+                eu_range_node = await self.get_node(nodeid).get_child(
+                    "0:EURange"
+                )
+                eu_range = await eu_range_node.read_value()
+            except ua.UaStatusCodeError as e:
+                _LOGGER.debug("No EURange for %s on %s: %s", nodeid, self.hub_name, e)
+                continue
+            spans[nodeid] = eu_range.High - eu_range.Low
+        return spans
+
 
 class AsyncuaCoordinator(DataUpdateCoordinator):
     """Coordinator to manage fetching data using OpcuaHub from OPCUA server."""
@@ -372,11 +1983,61 @@ class AsyncuaCoordinator(DataUpdateCoordinator):
         name: str,
         hub: OpcuaHub,
         update_interval_in_second: timedelta = DEFAULT_SCAN_INTERVAL,
+        subscription: bool = False,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        With subscription enabled, values are pushed by the server and the
+        scan interval only checks that the session and subscription are up.
+        Otherwise nodes with their own scan_interval form polling groups and
+        the coordinator ticks at the greatest common divisor of all groups.
+        """
         self._hub = hub
         self._sensors: list = []
         self._node_key_pair: dict[str, str] = {}
+        """Keys reading each nodeid whole, the reverse of _node_key_pair"""
+        self._node_consumers: dict[str, list[str]] = {}
+        self._default_interval = update_interval_in_second
+        self._node_intervals: dict[str, timedelta] = {}
+        """Bit index of keys unpacked from a status word, and the unpack plan"""
+        self._node_bits: dict[str, int] = {}
+        self._bit_plan: tuple[
+            list[tuple[str, int | None]], list[str], Any, Any
+        ] | None = None
+        """Element index of keys on an array node, and per array node the
+        IndexRange read and (range start, [(key, index)]) to fan out"""
+        self._node_index: dict[str, int] = {}
+        self._index_ranges: dict[str, str] = {}
+        self._array_elements: dict[str, tuple[int, list[tuple[str, int]]]] = {}
+        self._scan_groups: dict[timedelta, dict[str, str]] = {}
+        self._group_next_due: dict[timedelta, float] = {}
+        """Groups faster than the coordinator tick, each read from its own timer"""
+        self._fast_groups: dict[timedelta, dict[str, str]] = {}
+        self._fast_timers: dict[timedelta, CALLBACK_TYPE] = {}
+        self._fast_polls: dict[timedelta, asyncio.Task] = {}
+        self._read_payloads: dict[
+            frozenset[timedelta], tuple[dict[str, str], list[Node]]
+        ] = {}
+        self._read_payloads_epoch: int = hub.node_epoch
+        self._registration_pending: bool = False
+        self._keyed_listeners: dict[Any, set[CALLBACK_TYPE]] = {}
+        self._deadbands: dict[str, tuple[float | None, float | None]] = {}
+        self._eu_spans: dict[str, float] = {}
+        self._eu_ranges_read: set[str] = set()
+        self._changed_keys: set[str] | None = None
+        """Next retry time of nodeids that read bad, left out of regular polls"""
+        self._quarantine: dict[str, float] = {}
+        self._quarantine_retry = DEFAULT_QUARANTINE_RETRY
+        """Sensors backfilled after outages (key: entity_id, unit), and outages pending"""
+        self._history_targets: dict[str, tuple[str, str | None]] = {}
+        self._history_windows: list[tuple[datetime, datetime]] = []
+        self._backfill_task: asyncio.Task | None = None
+        self._subscription = subscription and hub.persistent_session
+        if subscription and not hub.persistent_session:
+            _LOGGER.warning(
+                "Subscription on %s requires a persistent session, polling instead",
+                name,
+            )
         super().__init__(
             hass=hass,
             logger=_LOGGER,
@@ -399,16 +2060,844 @@ class AsyncuaCoordinator(DataUpdateCoordinator):
         """Return all the node key pairs mapped to the OpcuaHub."""
         return self._node_key_pair
 
+    @property
+    def subscription(self) -> bool:
+        """Return True if node values are pushed by a subscription."""
+        return self._subscription
+
+    @staticmethod
+    def _sensor_node(val_sensor: dict[str, Any]) -> tuple[str, int | None, int | None]:
+        """Return the canonical nodeid, array index and bit a sensor reads.
+
+        NodeIds are compared in canonical form, so ns=2;i=0005 and ns=2;i=5
+        are one node. A NodeId that does not parse is kept as written and
+        fails on its first read.
+        """
+        nodeid, index = split_array_nodeid(val_sensor[CONF_NODE_ID])
+        if val_sensor.get(CONF_NODE_INDEX) is not None:
+            index = int(val_sensor[CONF_NODE_INDEX])
+        try:
+            nodeid = normalize_nodeid(nodeid)
+        except (ValueError, ua.UaError):
+            pass
+        bit = val_sensor.get(CONF_NODE_BIT)
+        return nodeid, index, None if bit is None else int(bit)
+
     def add_sensors(self, sensors: list[dict[str, str]]) -> bool:
-        """Add new sensors to the sensor list."""
+        """Add new sensors to the sensor list and index their nodes.
+
+        Entity data is keyed by name, so a name already reading another
+        node, array element or bit is rejected before anything is added.
+        """
+        sensor_nodes = {}
+        for val_sensor in sensors:
+            name = val_sensor[CONF_NODE_NAME]
+            sensor_node = self._sensor_node(val_sensor)
+            if name in self._node_key_pair:
+                existing = (
+                    self._node_key_pair[name],
+                    self._node_index.get(name),
+                    self._node_bits.get(name),
+                )
+            else:
+                existing = sensor_nodes.get(name, sensor_node)
+            if existing != sensor_node:
+                raise ConfigEntryError(
+                    f"Entity name {name} is used twice on asyncua hub {self.name}. "
+                    "Give every entity of a hub a unique name."
+                )
+            sensor_nodes[name] = sensor_node
         self._sensors.extend(sensors)
-        for _idx_sensor, val_sensor in enumerate(self._sensors):
-            self._node_key_pair[val_sensor[CONF_NODE_NAME]] = val_sensor[CONF_NODE_ID]
+        for _idx_sensor, val_sensor in enumerate(sensors):
+            nodeid, index, bit = sensor_nodes[val_sensor[CONF_NODE_NAME]]
+            self._node_key_pair[val_sensor[CONF_NODE_NAME]] = nodeid
+            if index is not None:
+                self._node_index[val_sensor[CONF_NODE_NAME]] = index
+            else:
+                self._node_index.pop(val_sensor[CONF_NODE_NAME], None)
+            if bit is not None:
+                self._node_bits[val_sensor[CONF_NODE_NAME]] = bit
+            else:
+                self._node_bits.pop(val_sensor[CONF_NODE_NAME], None)
+            self._bit_plan = None
+            scan_interval = val_sensor.get(CONF_NODE_SCAN_INTERVAL)
+            self._node_intervals[val_sensor[CONF_NODE_NAME]] = (
+                timedelta(seconds=scan_interval)
+                if scan_interval
+                else self._default_interval
+            )
+            deadband = val_sensor.get(CONF_NODE_DEADBAND)
+            deadband_percent = val_sensor.get(CONF_NODE_DEADBAND_PERCENT)
+            if deadband is not None or deadband_percent is not None:
+                self._deadbands[val_sensor[CONF_NODE_NAME]] = (
+                    deadband,
+                    deadband_percent,
+                )
+        self.hub.resolve_nodes(
+            dict.fromkeys(
+                self._node_key_pair[val_sensor[CONF_NODE_NAME]]
+                for val_sensor in sensors
+            )
+        )
+        self._update_node_consumers()
+        self._update_array_elements()
+        if any(
+            deadband_percent is not None
+            and self._node_key_pair[key] not in self._eu_ranges_read
+            for key, (_deadband, deadband_percent) in self._deadbands.items()
+        ):
+            self.hass.async_create_task(self._async_load_eu_ranges())
+        if self._subscription:
+            if self.data is not None:
+                self.hass.async_create_task(self._async_subscribe())
+        else:
+            self._update_scan_groups()
+            self._registration_pending = self.hub.persistent_session
+        return True
+
+    @callback
+    def add_history_target(
+        self, key: str, entity_id: str, unit: str | None
+    ) -> Callable[[], None]:
+        """Backfill the statistics of a measurement sensor after outages."""
+        self._history_targets[key] = (entity_id, unit)
+
+        @callback
+        def remove_history_target() -> None:
+            self._history_targets.pop(key, None)
+
+        return remove_history_target
+
+    def _queue_backfill(self) -> None:
+        """Queue the outages the hub recovered from for a history backfill.
+
+        Only persistent hubs backfill, as the reads span many requests, and
+        only while the recorder runs and the server keeps history.
+        """
+        self._history_windows.extend(self.hub.pop_outages())
+        if not self._history_windows or self._backfill_task is not None:
+            return
+        if (
+            not self._history_targets
+            or not self.hub.persistent_session
+            or not self.hub.history_supported
+            or "recorder" not in self.hass.config.components
+        ):
+            self._history_windows = []
+            return
+        self._backfill_task = self.hass.async_create_background_task(
+            self._async_backfill(), f"{self.name} history backfill"
+        )
+
+    async def _async_backfill(self) -> None:
+        """Backfill the queued outages one after the other.
+
+        Whole hours are imported, once the last one has ended and the
+        recorder has compiled it from the states it saw. A window that
+        fails on the connection or session stays queued for the next
+        recovery.
+        """
+        try:
+            while self._history_windows:
+                start, end = self._history_windows[0]
+                start, end = floor_hour(start), ceil_hour(end)
+                wait = (end - dt_util.utcnow()).total_seconds() + DEFAULT_BACKFILL_DELAY
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                try:
+                    await self._async_backfill_window(start, end)
+                except (ConnectionError, TimeoutError) as e:
+                    _LOGGER.warning(
+                        "History backfill of %s interrupted, retrying after reconnect: %s",
+                        self.name,
+                        e,
+                    )
+                    return
+                except ua.UaStatusCodeError as e:
+                    if e.code not in SESSION_STATUS_CODES:
+                        _LOGGER.warning(
+                            "History backfill of %s from %s to %s failed: %s",
+                            self.name,
+                            start,
+                            end,
+                            e,
+                        )
+                        self._history_windows.pop(0)
+                        continue
+                    _LOGGER.warning(
+                        "History backfill of %s interrupted, retrying after reconnect: %s",
+                        self.name,
+                        e,
+                    )
+                    return
+                except Exception as e:  # pylint: disable=broad-except
+                    _LOGGER.warning(
+                        "History backfill of %s from %s to %s failed: %s",
+                        self.name,
+                        start,
+                        end,
+                        e,
+                    )
+                self._history_windows.pop(0)
+        finally:
+            self._backfill_task = None
+
+    async def _async_backfill_window(self, start: datetime, end: datetime) -> None:
+        """Import the hourly statistics of every target between start and end.
+
+        Each HistoryRead page is folded into per sensor hourly accumulators
+        and the hours it completes are imported right away, so the outage
+        is streamed into the recorder instead of held in memory.
+        """
+        targets = dict(self._history_targets)
+        keys_by_node: dict[str, list[str]] = {}
+        for key in targets:
+            nodeid = self._node_key_pair.get(key)
+            if nodeid is not None:
+                keys_by_node.setdefault(nodeid, []).append(key)
+        accumulators = {key: HourlyMean(start) for key in targets}
+        async for page in self.hub.async_read_history(keys_by_node, start, end):
+            for nodeid, data_values in page.items():
+                for key in keys_by_node[nodeid]:
+                    hours = []
+                    for moment, value in self._history_samples(key, data_values):
+                        hours.extend(accumulators[key].add(moment, value))
+                    self._import_statistics(targets[key], hours)
+        for key, accumulator in accumulators.items():
+            self._import_statistics(targets[key], accumulator.close(end))
+        _LOGGER.info("Backfilled %s from %s to %s", self.name, start, end)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the history backfill, drop the outages still queued and stop fast polls.
+
+        Called before the hub disconnects, so no backfill wakes up later
+        and reconnects a hub that was unloaded.
+        """
+        self._history_windows = []
+        if self._backfill_task is not None:
+            self._backfill_task.cancel()
+            self._backfill_task = None
+        self._cancel_fast_groups()
+        await super().async_shutdown()
+
+    def _history_samples(
+        self, key: str, data_values: list[DataValue]
+    ) -> Iterable[tuple[datetime, float]]:
+        """Yield the timestamp and numeric value of key in historical values."""
+        for data_value in data_values:
+            if data_value.StatusCode is not None and data_value.StatusCode.is_bad():
+                continue
+            try:
+                value = float(self._unpack_value(key, data_value.Value.Value))
+            except (TypeError, ValueError):
+                continue
+            moment = data_value.SourceTimestamp or data_value.ServerTimestamp
+            if moment is None:
+                continue
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            yield moment, value
+
+    def _import_statistics(
+        self, target: tuple[str, str | None], hours: list[dict]
+    ) -> None:
+        """Hand hourly statistics of one sensor to the recorder."""
+        if not hours:
+            return
+        entity_id, unit = target
+        async_import_statistics(
+            self.hass,
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": entity_id,
+                "unit_of_measurement": unit,
+            },
+            hours,
+        )
+
+    def key_available(self, key: str) -> bool:
+        """Return False while the node of key is quarantined after a bad read."""
+        return self._node_key_pair.get(key) not in self._quarantine
+
+    def _due_quarantined(self) -> dict[str, str]:
+        """Return the quarantined nodes due for a retry."""
+        now = time.monotonic()
+        due = {
+            nodeid
+            for nodeid, retry_at in self._quarantine.items()
+            if retry_at <= now
+        }
+        for nodeid in due:
+            self._quarantine[nodeid] = now + self._quarantine_retry
+        return {nodeid: nodeid for nodeid in due}
+
+    def _update_quarantine(self, node_key_pair: dict[str, str]) -> set[str]:
+        """Quarantine nodes that read bad and release those that recovered.
+
+        Returns the keys whose availability changed.
+        """
+        changed_nodeids = set()
+        for nodeid in node_key_pair.values():
+            if nodeid in self.hub.bad_nodes and nodeid not in self._quarantine:
+                _LOGGER.warning(
+                    "Quarantining %s on %s, retrying every %s s",
+                    nodeid,
+                    self.name,
+                    self._quarantine_retry,
+                )
+                self._quarantine[nodeid] = time.monotonic() + self._quarantine_retry
+                changed_nodeids.add(nodeid)
+            elif nodeid not in self.hub.bad_nodes and nodeid in self._quarantine:
+                _LOGGER.info("%s on %s reads good again", nodeid, self.name)
+                del self._quarantine[nodeid]
+                changed_nodeids.add(nodeid)
+        if not changed_nodeids:
+            return set()
+        self._update_scan_groups()
+        return {
+            key
+            for key, nodeid in self._node_key_pair.items()
+            if nodeid in changed_nodeids
+        }
+
+    async def async_read_keys(self, keys: Iterable[str]) -> None:
+        """Read the nodes of keys now and notify only the entities using them.
+
+        Other entities sharing a node read here are updated along with them.
+        """
+        node_key_pair = self._read_pairs(
+            {key: self._node_key_pair[key] for key in keys if key in self._node_key_pair}
+        )
+        vals = self._unpack(
+            await self.hub.get_values(
+                node_key_pair=node_key_pair, index_ranges=self._index_ranges
+            )
+            or {}
+        )
+        if not self.hub.connected:
+            return
+        availability_changed = self._update_quarantine(node_key_pair)
+        if self.data is None:
+            self.data = {}
+        self.data.update(vals or {})
+        self.async_update_listeners_for_keys({*(vals or {}), *availability_changed})
+
+    def _update_scan_groups(self) -> None:
+        """Group nodes by scan interval and set the coordinator tick.
+
+        A node shared by several keys is read once, in the group of the
+        fastest of them. A subscribed coordinator has no groups, its tick
+        only keeps the subscription in sync.
+        """
+        if self._subscription:
+            return
+        node_intervals: dict[str, timedelta] = {}
+        for key, nodeid in self._node_key_pair.items():
+            if nodeid in self._quarantine:
+                continue
+            interval = self._node_intervals.get(key, self._default_interval)
+            if nodeid not in node_intervals or interval < node_intervals[nodeid]:
+                node_intervals[nodeid] = interval
+        scan_groups: dict[timedelta, dict[str, str]] = {}
+        fast_groups: dict[timedelta, dict[str, str]] = {}
+        min_interval = timedelta(seconds=MIN_COORDINATOR_INTERVAL)
+        for nodeid, interval in node_intervals.items():
+            groups = fast_groups if interval < min_interval else scan_groups
+            groups.setdefault(interval, {})[nodeid] = nodeid
+        self._scan_groups = scan_groups
+        self._read_payloads = {}
+        self._group_next_due = {
+            interval: self._group_next_due.get(interval, 0.0)
+            for interval in scan_groups
+        }
+        self._update_fast_groups(fast_groups)
+        intervals_ms = [
+            max(round(interval.total_seconds() * 1000), 1) for interval in scan_groups
+        ]
+        if intervals_ms:
+            # HA schedules refreshes on whole seconds, never tick faster
+            self.update_interval = max(
+                timedelta(milliseconds=math.gcd(*intervals_ms)), min_interval
+            )
+
+    def _update_fast_groups(self, fast_groups: dict[timedelta, dict[str, str]]) -> None:
+        """Start a timer for every group faster than the coordinator tick.
+
+        The DataUpdateCoordinator refresh is scheduled on whole seconds, so
+        sub-second groups are read from timers of their own instead.
+        """
+        self._fast_groups = fast_groups
+        for interval in [i for i in self._fast_timers if i not in fast_groups]:
+            self._fast_timers.pop(interval)()
+        for interval in fast_groups:
+            if interval not in self._fast_timers:
+                self._fast_timers[interval] = async_track_time_interval(
+                    self.hass,
+                    functools.partial(self._async_fast_tick, interval),
+                    interval,
+                )
+
+    @callback
+    def _async_fast_tick(self, interval: timedelta, _now: datetime) -> None:
+        """Read a fast group, unless its previous read is still running."""
+        poll = self._fast_polls.get(interval)
+        if poll is not None and not poll.done():
+            return
+        if self.data is None or not self.last_update_success:
+            # Recovery and the first read go through the coordinator refresh
+            return
+        self._fast_polls[interval] = self.hass.async_create_background_task(
+            self._async_poll_fast_group(interval), f"{self.name} poll {interval}"
+        )
+
+    async def _async_poll_fast_group(self, interval: timedelta) -> None:
+        """Read one fast group and notify only the keys whose value changed."""
+        group = self._fast_groups.get(interval)
+        if not group:
+            return
+        node_key_pair, nodes = self._group_payload(frozenset((interval,)), [group])
+        vals = self._unpack(
+            await self.hub.get_values(
+                node_key_pair=node_key_pair,
+                nodes=nodes,
+                index_ranges=self._index_ranges,
+                payload_key=frozenset((interval,)),
+            )
+            or {}
+        )
+        if not self.hub.connected or self.data is None:
+            return
+        availability_changed = self._update_quarantine(node_key_pair)
+        vals = self._apply_deadband(vals)
+        changed_keys = {
+            key
+            for key, val in vals.items()
+            if key not in self.data or self.data[key] != val
+        }
+        self.data.update(vals)
+        if changed_keys or availability_changed:
+            self.async_update_listeners_for_keys(changed_keys | availability_changed)
+
+    def _cancel_fast_groups(self) -> None:
+        """Stop the timers and reads of the fast groups."""
+        for unsubscribe in self._fast_timers.values():
+            unsubscribe()
+        self._fast_timers = {}
+        for poll in self._fast_polls.values():
+            poll.cancel()
+        self._fast_polls = {}
+
+    def _read_pairs(self, node_key_pair: dict[str, str]) -> dict[str, str]:
+        """Map keys onto the nodes they read, each node once under its nodeid."""
+        return {nodeid: nodeid for nodeid in node_key_pair.values()}
+
+    def _update_node_consumers(self) -> None:
+        """Index the keys taking each node value whole, by nodeid.
+
+        Keys on a bit or an array element are indexed by the bit plan and
+        by _array_elements instead.
+        """
+        consumers: dict[str, list[str]] = {}
+        for key, nodeid in self._node_key_pair.items():
+            if key not in self._node_bits and key not in self._node_index:
+                consumers.setdefault(nodeid, []).append(key)
+        self._node_consumers = consumers
+
+    def _unpack(self, vals: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch the node values read, keyed by nodeid, to the keys using them."""
+        data = {
+            key: value
+            for nodeid, value in vals.items()
+            for key in self._node_consumers.get(nodeid, ())
+        }
+        elements = self._unpack_elements(vals, data) if self._array_elements else {}
+        if self._node_bits:
+            self._unpack_bits(vals, elements, data)
+        return data
+
+    def _update_array_elements(self) -> None:
+        """Work out the minimal IndexRange covering the elements of each array.
+
+        An array also read whole by another key, or by a bit, is read whole
+        once and its elements taken from there.
+        """
+        elements: dict[str, list[tuple[str, int]]] = {}
+        for key, index in self._node_index.items():
+            elements.setdefault(self._node_key_pair[key], []).append((key, index))
+        whole = set(self._node_consumers)
+        whole.update(
+            self._node_key_pair[key]
+            for key in self._node_bits
+            if key not in self._node_index
+        )
+        self._array_elements = {}
+        self._index_ranges = {}
+        for nodeid, keys in elements.items():
+            if nodeid in whole:
+                self._array_elements[nodeid] = (0, keys)
+                continue
+            first = min(index for _key, index in keys)
+            last = max(index for _key, index in keys)
+            self._array_elements[nodeid] = (first, keys)
+            self._index_ranges[nodeid] = (
+                str(first) if first == last else f"{first}:{last}"
+            )
+
+    def _unpack_elements(
+        self, vals: dict[str, Any], data: dict[str, Any]
+    ) -> dict[tuple[str, int], Any]:
+        """Fan each array read out to the keys of its elements.
+
+        The array holds the covering range only, so every key indexes it
+        shifted by the range start; the elements are taken straight from
+        the array returned, nothing is sliced per key. Returns the elements
+        by (nodeid, index), for the bits taken from an element.
+        """
+        elements: dict[tuple[str, int], Any] = {}
+        for nodeid, (first, keys) in self._array_elements.items():
+            array = vals.get(nodeid)
+            if not isinstance(array, (list, tuple)):
+                if array is not None:
+                    _LOGGER.warning("%s on %s is not an array", nodeid, self.name)
+                continue
+            for key, index in keys:
+                offset = index - first
+                element = array[offset] if offset < len(array) else None
+                elements[(nodeid, index)] = element
+                if key not in self._node_bits:
+                    data[key] = element
+        return elements
+
+    def _unpack_bits(
+        self,
+        vals: dict[str, Any],
+        elements: dict[tuple[str, int], Any],
+        data: dict[str, Any],
+    ) -> None:
+        """Set the bits of binary sensors from the status words read.
+
+        All bits of all words read are shifted and masked in one vectorized
+        pass, following a plan built once per set of bit sensors. A word is
+        a node value, or an array element for keys with an index.
+        """
+        if self._bit_plan is None:
+            self._bit_plan = self._build_bit_plan()
+        sources, keys, word_index, shifts = self._bit_plan
+        words = []
+        present = []
+        for nodeid, index in sources:
+            word = vals.get(nodeid) if index is None else elements.get((nodeid, index))
+            try:
+                words.append(int(word) & WORD_MASK)
+                present.append(True)
+            except (TypeError, ValueError):
+                words.append(0)
+                present.append(False)
+        if not any(present):
+            return
+        if np is None:
+            data.update(
+                (key, bool(words[idx] >> shift & 1))
+                for key, idx, shift in zip(keys, word_index, shifts)
+                if present[idx]
+            )
+            return
+        bits = (np.array(words, dtype=np.uint64)[word_index] >> shifts) & np.uint64(1)
+        keep = np.array(present)[word_index]
+        data.update(zip(compress(keys, keep), bits[keep].astype(bool).tolist()))
+
+    def _build_bit_plan(
+        self,
+    ) -> tuple[list[tuple[str, int | None]], list[str], Any, Any]:
+        """Return the words, bit keys, word of each key and shift of each key.
+
+        Each word is the (nodeid, array index or None) it is taken from.
+        """
+        keys = list(self._node_bits)
+        key_sources = [
+            (self._node_key_pair[key], self._node_index.get(key)) for key in keys
+        ]
+        sources = list(dict.fromkeys(key_sources))
+        position = {source: idx for idx, source in enumerate(sources)}
+        word_index = [position[source] for source in key_sources]
+        shifts = [self._node_bits[key] for key in keys]
+        if np is not None:
+            word_index = np.array(word_index, dtype=np.intp)
+            shifts = np.array(shifts, dtype=np.uint64)
+        return sources, keys, word_index, shifts
+
+    def _unpack_value(self, key: str, value: Any) -> Any:
+        """Return the element or bit of key in a whole node value.
+
+        Used for pushed and historical values, which hold the full array
+        rather than the covering range of a poll.
+        """
+        index = self._node_index.get(key)
+        if index is not None:
+            try:
+                value = value[index]
+            except (TypeError, IndexError):
+                return None
+        bit = self._node_bits.get(key)
+        if bit is None:
+            return value
+        try:
+            return bool(int(value) >> bit & 1)
+        except (TypeError, ValueError):
+            return None
+
+    def _due_read_payload(
+        self,
+    ) -> tuple[dict[str, str], list[Node], frozenset[timedelta]]:
+        """Return the nodes of every polling group due at this tick.
+
+        All groups due at the same tick are merged into one batched read.
+        After an outage (no data) every group is read at once. The merged
+        payload of each combination of groups is built once and reused,
+        and returned with the key naming it.
+        """
+        if len(self._scan_groups) <= 1 or not self.data:
+            due_groups = list(self._scan_groups)
+        else:
+            now = time.monotonic()
+            tolerance = self.update_interval.total_seconds() / 2
+            due_groups = [
+                interval
+                for interval, next_due in self._group_next_due.items()
+                if next_due - tolerance <= now
+            ]
+        now = time.monotonic()
+        for interval in due_groups:
+            self._group_next_due[interval] = now + interval.total_seconds()
+        payload_key = frozenset(due_groups)
+        payload = self._group_payload(
+            payload_key, [self._scan_groups[interval] for interval in due_groups]
+        )
+        return (*payload, payload_key)
+
+    def _group_payload(
+        self, payload_key: frozenset[timedelta], groups: list[dict[str, str]]
+    ) -> tuple[dict[str, str], list[Node]]:
+        """Return the merged nodes of groups and their Nodes, built once per key."""
+        if self._read_payloads_epoch != self.hub.node_epoch:
+            # The hub moved to another client, cached Nodes belong to the old one
+            self._read_payloads = {}
+            self._read_payloads_epoch = self.hub.node_epoch
+        payload = self._read_payloads.get(payload_key)
+        if payload is None:
+            node_key_pair: dict[str, str] = {}
+            for group in groups:
+                node_key_pair.update(group)
+            payload = (node_key_pair, self.hub.resolve_nodes(node_key_pair.values()))
+            self._read_payloads[payload_key] = payload
+        return payload
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the data key in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._keyed_listeners.setdefault(context, set()).add(update_callback)
+
+        @callback
+        def remove_keyed_listener() -> None:
+            """Remove update listener."""
+            remove_listener()
+            listeners = self._keyed_listeners.get(context)
+            if listeners is not None:
+                listeners.discard(update_callback)
+                if not listeners:
+                    del self._keyed_listeners[context]
+
+        return remove_keyed_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose keys changed in the last refresh.
+
+        Without a diff (first refresh, recovery after a failed update) every
+        listener is notified.
+        """
+        changed_keys = self._changed_keys
+        self._changed_keys = None
+        if changed_keys is None:
+            super().async_update_listeners()
+            return
+        self.async_update_listeners_for_keys(changed_keys)
+
+    @callback
+    def async_update_listeners_for_keys(self, keys: Iterable[str]) -> None:
+        """Notify the listeners registered for keys and those without a key."""
+        update_callbacks = list(self._keyed_listeners.get(None, ()))
+        for key in keys:
+            update_callbacks.extend(self._keyed_listeners.get(key, ()))
+        for update_callback in update_callbacks:
+            update_callback()
+
+    def _diff_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Remember which keys differ from the current snapshot."""
+        previous = self.data
+        if previous is None or not self.last_update_success:
+            self._changed_keys = None
+            return data
+        changed_keys = {
+            key
+            for key, val in data.items()
+            if key not in previous or previous[key] != val
+        }
+        changed_keys.update(key for key in previous if key not in data)
+        self._changed_keys = changed_keys
+        return data
+
+    async def _async_load_eu_ranges(self) -> None:
+        """Read the EURange of nodes with a percent deadband."""
+        nodeids = [
+            self._node_key_pair[key]
+            for key, (_deadband, deadband_percent) in self._deadbands.items()
+            if deadband_percent is not None
+            and self._node_key_pair[key] not in self._eu_ranges_read
+        ]
+        spans = await self.hub.get_eu_ranges(nodeids=nodeids)
+        if not self.hub.connected:
+            return
+        self._eu_spans.update(spans)
+        self._eu_ranges_read.update(nodeids)
+        for nodeid in nodeids:
+            if nodeid not in self._eu_spans:
+                _LOGGER.warning(
+                    "Node %s on %s has no EURange, percent deadband is not applied",
+                    nodeid,
+                    self.name,
+                )
+
+    def _outside_deadband(self, key: str, previous: Any, value: Any) -> bool:
+        """Return True if value moved further than the deadband of key."""
+        deadband = self._deadbands.get(key)
+        if deadband is None or previous is None:
+            return True
+        try:
+            delta = abs(float(value) - float(previous))
+        except (TypeError, ValueError):
+            return True
+        absolute, percent = deadband
+        if absolute is not None and delta <= absolute:
+            return False
+        if percent is not None:
+            span = self._eu_spans.get(self._node_key_pair.get(key))
+            if span and delta <= abs(span) * percent / 100:
+                return False
         return True
 
+    def _apply_deadband(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Keep the previous value of keys that moved within their deadband."""
+        previous = self.data
+        if not previous or not self._deadbands:
+            return data
+        for key in self._deadbands:
+            if key in data and key in previous:
+                if not self._outside_deadband(key, previous[key], data[key]):
+                    data[key] = previous[key]
+        return data
+
+    def _monitored_item_filters(self) -> dict[str, tuple[ua.DeadbandType, float]]:
+        """Return the DataChangeFilter deadband of each node, keyed by nodeid.
+
+        Absolute wins over percent. Nodes shared with entities that use a
+        different or no deadband are monitored without a filter.
+        """
+        filters: dict[str, tuple[ua.DeadbandType, float] | None] = {}
+        for key, nodeid in self._node_key_pair.items():
+            deadband = self._deadbands.get(key)
+            if deadband is None:
+                spec = None
+            elif deadband[0] is not None:
+                spec = (ua.DeadbandType.Absolute, deadband[0])
+            else:
+                spec = (ua.DeadbandType.Percent, deadband[1])
+            if nodeid in filters and filters[nodeid] != spec:
+                spec = None
+            filters[nodeid] = spec
+        return {nodeid: spec for nodeid, spec in filters.items() if spec is not None}
+
+    @callback
+    def _async_handle_data_change(self, keys: list[str], value: Any) -> None:
+        """Store a pushed value and notify only the entities using it."""
+        if self.data is None:
+            self.data = {}
+        values = {key: self._unpack_value(key, value) for key in keys}
+        changed_keys = [
+            key
+            for key, key_value in values.items()
+            # Values pushed again, as after the subscription is recreated,
+            # and bits of a word that did not flip stay quiet
+            if (key not in self.data or self.data[key] != key_value)
+            and self._outside_deadband(key, self.data.get(key), key_value)
+        ]
+        for key in changed_keys:
+            self.data[key] = values[key]
+        if changed_keys:
+            self.async_update_listeners_for_keys(changed_keys)
+
+    async def _async_subscribe(self) -> None:
+        """Create or update the subscription for all registered nodes."""
+        await self.hub.subscribe(
+            node_key_pair=self.node_key_pair,
+            on_change=self._async_handle_data_change,
+            deadbands=self._monitored_item_filters(),
+        )
+
+    def _raise_if_circuit_open(self) -> None:
+        """Fail the update while the hub is reconnecting with backoff."""
+        if self.hub.circuit_open:
+            raise UpdateFailed(
+                f"{self.hub.hub_name} @ {self.hub.hub_url} is unreachable "
+                f"({self.hub.state}), reconnecting in the background"
+            )
+
     async def _async_update_data(self) -> dict[str, Any]:
-        """Update the state of the sensor."""
-        vals = await self.hub.get_values(node_key_pair=self.node_key_pair)
+        """Update the state of the sensor.
+
+        While the hub circuit is open the update fails without any I/O, so
+        every entity turns unavailable through this one failed update. A
+        degraded hub keeps the last values until the circuit opens.
+        """
+        self._changed_keys = None
+        self._raise_if_circuit_open()
+        if self._subscription:
+            await self._async_subscribe()
+            self._raise_if_circuit_open()
+            if self.hub.connected:
+                self._queue_backfill()
+            return self._diff_data(dict(self.data or {}))
+        if self._registration_pending:
+            self._registration_pending = not await self.hub.register_nodes(
+                nodeids=self._node_key_pair.values()
+            )
+        node_key_pair, nodes, payload_key = self._due_read_payload()
+        retry = self._due_quarantined()
+        if retry:
+            node_key_pair, nodes = {**node_key_pair, **retry}, None
+        vals = self._unpack(
+            await self.hub.get_values(
+                node_key_pair=node_key_pair,
+                nodes=nodes,
+                index_ranges=self._index_ranges,
+                payload_key=payload_key if nodes is not None else None,
+            )
+            or {}
+        )
+        self._raise_if_circuit_open()
         if not self.hub.connected:
-            return {}
-        return {**vals} if vals is not None else {}
+            return self._diff_data(dict(self.data or {}))
+        availability_changed = self._update_quarantine(node_key_pair)
+        self._queue_backfill()
+        data = self._diff_data(
+            self._apply_deadband({**(self.data or {}), **(vals or {})})
+        )
+        if self._changed_keys is not None:
+            self._changed_keys.update(availability_changed)
+        return data
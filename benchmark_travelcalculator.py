@@ -0,0 +1,109 @@
+"""Compare TravelCalculator with TravelCalculatorBank for a fleet of covers.
+
+Run with ``python benchmark_travelcalculator.py`` from any directory. Each
+round starts every cover travelling and then reads all positions the way
+the cover motion scheduler does on one tick, once on their own and once
+followed by the reads of writing the state of every cover.
+"""
+import os
+import random
+import sys
+import timeit
+
+# travelcalculator.py sits next to this script, which is not a package
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from travelcalculator import TravelCalculator, TravelCalculatorBank, TravelStatus  # noqa: E402
+
+FLEET_SIZES = (10, 50, 100, 1000)
+ROUNDS = 200
+
+_DIRECTION_UP = TravelStatus.DIRECTION_UP.value
+_DIRECTION_DOWN = TravelStatus.DIRECTION_DOWN.value
+
+
+def _scalar_fleet(size):
+    """Return travelling scalar calculators."""
+    fleet = [
+        TravelCalculator(random.randint(10, 60), random.randint(10, 60))
+        for _ in range(size)
+    ]
+    for travel_calculator in fleet:
+        travel_calculator.set_position(random.randint(0, 100))
+        travel_calculator.start_travel(random.randint(0, 100))
+    return fleet
+
+
+def _banked_fleet(size):
+    """Return a bank with travelling covers and their views."""
+    bank = TravelCalculatorBank()
+    views = []
+    for _ in range(size):
+        view = bank.add(random.randint(10, 60), random.randint(10, 60))
+        view.set_position(random.randint(0, 100))
+        view.start_travel(random.randint(0, 100))
+        views.append(view)
+    return bank, views
+
+
+def _write_state(travel_calculator):
+    """Read what writing the state of a cover reads from its calculator."""
+    return (
+        travel_calculator.current_position(),
+        travel_calculator.travel_direction_code == _DIRECTION_UP
+        and travel_calculator.is_traveling(),
+        travel_calculator.travel_direction_code == _DIRECTION_DOWN
+        and travel_calculator.is_traveling(),
+        travel_calculator.is_closed(),
+    )
+
+
+def _scalar_tick(fleet):
+    """Tick a scalar fleet and write the state of every cover."""
+    for travel_calculator in fleet:
+        travel_calculator.current_position()
+        _write_state(travel_calculator)
+
+
+def _banked_tick(bank, views):
+    """Tick a banked fleet and write the state of every cover."""
+    positions = bank.freeze()
+    try:
+        for view in views:
+            positions[view.row]
+            _write_state(view)
+    finally:
+        bank.thaw()
+
+
+def _time(func):
+    """Return the time of one call of func, in microseconds."""
+    return timeit.timeit(func, number=ROUNDS) / ROUNDS * 1e6
+
+
+def main():
+    """Print the time of one tick over the fleet for each fleet size."""
+    if not TravelCalculatorBank.available():
+        print("numpy is not installed, TravelCalculatorBank is unavailable")
+        return
+
+    print(
+        f"{'covers':>8} {'positions scalar':>17} {'bank':>8} "
+        f"{'tick+state scalar':>18} {'bank':>8} {'speedup':>8}   (us)"
+    )
+    for size in FLEET_SIZES:
+        fleet = _scalar_fleet(size)
+        bank, views = _banked_fleet(size)
+        scalar = _time(lambda: [tc.current_position() for tc in fleet])
+        banked = _time(bank.current_positions)
+        scalar_tick = _time(lambda: _scalar_tick(fleet))
+        banked_tick = _time(lambda: _banked_tick(bank, views))
+        print(
+            f"{size:>8} {scalar:>17.1f} {banked:>8.1f} "
+            f"{scalar_tick:>18.1f} {banked_tick:>8.1f} "
+            f"{scalar_tick / banked_tick:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
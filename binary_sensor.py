@@ -22,10 +22,12 @@ from homeassistant.helpers.device_registry import DeviceInfo
 
 from . import AsyncuaCoordinator
 from .const import (
+    CONF_NODE_BIT,
     CONF_NODE_DEVICE_CLASS,
     CONF_NODE_HUB,
     CONF_NODE_ID,
     CONF_NODE_NAME,
+    CONF_NODE_SCAN_INTERVAL,
     CONF_NODE_UNIQUE_ID,
     CONF_NODES,
     DOMAIN,
@@ -39,8 +41,14 @@ NODE_SCHEMA = {
             vol.Optional(CONF_NODE_DEVICE_CLASS): cv.string,
             vol.Optional(CONF_NODE_UNIQUE_ID): cv.string,
             vol.Required(CONF_NODE_ID): cv.string,
+            vol.Optional(CONF_NODE_BIT): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=63)
+            ),
             vol.Required(CONF_NODE_NAME): cv.string,
             vol.Required(CONF_NODE_HUB): cv.string,
+            vol.Optional(CONF_NODE_SCAN_INTERVAL): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1)
+            ),
         }
     ]
 }
@@ -89,6 +97,7 @@ async def async_setup_entry(
                 hub=bs.get(CONF_NODE_HUB, hub_id),
                 node_id=bs.get(CONF_NODE_ID),
                 device_class=bs.get(CONF_NODE_DEVICE_CLASS),
+                bit=bs.get(CONF_NODE_BIT),
             )
         )
 
@@ -138,13 +147,18 @@ async def async_setup_platform(
                     hub=val_sensor[CONF_NODE_HUB],
                     node_id=val_sensor[CONF_NODE_ID],
                     device_class=val_sensor.get(CONF_NODE_DEVICE_CLASS),
+                    bit=val_sensor.get(CONF_NODE_BIT),
                 )
             )
     async_add_entities(new_entities=asyncua_sensors)
 
 
 class AsyncuaBinarySensor(CoordinatorEntity[AsyncuaCoordinator], BinarySensorEntity):
-    """A binary sensor implementation for Asyncua OPCUA nodes."""
+    """A binary sensor implementation for Asyncua OPCUA nodes.
+
+    With a bit index the sensor shows one bit of a packed status word; the
+    coordinator reads the word once for all of its bit sensors.
+    """
 
     _attr_has_entity_name = False
 
@@ -156,15 +170,17 @@ class AsyncuaBinarySensor(CoordinatorEntity[AsyncuaCoordinator], BinarySensorEnt
         node_id: str,
         device_class: Any,
         unique_id: str | None = None,
+        bit: int | None = None,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, context=name)
         self._attr_name = name
         self._hub = hub
         self._node_id = node_id
-        self._attr_unique_id = (
-            unique_id if unique_id is not None else node_id
-        )
+        self._bit = bit
+        if unique_id is None:
+            unique_id = node_id if bit is None else f"{node_id}.{bit}"
+        self._attr_unique_id = unique_id
         self._attr_available = False
         self._attr_device_class = device_class
         self._attr_is_on: bool | None = None
@@ -180,6 +196,11 @@ class AsyncuaBinarySensor(CoordinatorEntity[AsyncuaCoordinator], BinarySensorEnt
         )
         return self._attr_is_on
 
+    @property
+    def available(self) -> bool:
+        """Return False while the node is quarantined after a bad read."""
+        return super().available and self.coordinator.key_available(self._attr_name)
+
     @property
     def unique_id(self) -> str | None:
         """Return the unique_id of the sensor."""
@@ -200,6 +221,11 @@ class AsyncuaBinarySensor(CoordinatorEntity[AsyncuaCoordinator], BinarySensorEnt
         """Return the node address provided by the OPCUA server."""
         return self._node_id
 
+    @property
+    def bit(self) -> int | None:
+        """Return the bit of the status word shown, None for a Boolean node."""
+        return self._bit
+
     def _parse_coordinator_data(
         self,
         coordinator_data: dict[str, Any],
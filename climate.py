@@ -22,7 +22,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from . import AsyncuaCoordinator
-from .const import CONF_HUB_ID, DOMAIN
+from .const import CONF_HUB_ID, CONF_NODE_ID, CONF_NODE_NAME, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +91,9 @@ async def async_setup_entry(
         )
 
     if asyncua_climate:
+        coordinator.add_sensors(
+            [sensor for climate in asyncua_climate for sensor in climate.data_sensors]
+        )
         async_add_entities(new_entities=asyncua_climate)
 
     return True
@@ -123,8 +126,24 @@ class AsyncuaClimate(CoordinatorEntity[AsyncuaCoordinator], ClimateEntity):
         min_temp: float = DEFAULT_MIN_TEMP,
         max_temp: float = DEFAULT_MAX_TEMP,
     ) -> None:
-        """Initialize the climate entity."""
-        super().__init__(coordinator=coordinator)
+        """Initialize the climate entity.
+
+        The first node read is the listener context; the entity listens
+        to the others once added.
+        """
+        self._data_keys = [
+            nodeid
+            for nodeid in (
+                current_temperature_node_id,
+                target_temperature_node_id,
+                hvac_mode_node_id,
+            )
+            if nodeid
+        ]
+        super().__init__(
+            coordinator=coordinator,
+            context=self._data_keys[0] if self._data_keys else unique_id,
+        )
 
         # Create entity description
         self.entity_description = AsyncuaClimateEntityDescription(
@@ -145,6 +164,24 @@ class AsyncuaClimate(CoordinatorEntity[AsyncuaCoordinator], ClimateEntity):
         self._attr_current_temperature = None
         self._attr_target_temperature = None
 
+    async def async_added_to_hass(self) -> None:
+        """Listen to the nodes read besides the listener context."""
+        await super().async_added_to_hass()
+        for key in self._data_keys[1:]:
+            self.async_on_remove(
+                self.coordinator.async_add_listener(
+                    self._handle_coordinator_update, key
+                )
+            )
+
+    @property
+    def data_sensors(self) -> list[dict[str, str]]:
+        """Return the nodes read through the coordinator, keyed by nodeid."""
+        return [
+            {CONF_NODE_NAME: nodeid, CONF_NODE_ID: nodeid}
+            for nodeid in dict.fromkeys(self._data_keys)
+        ]
+
     @property
     def unique_id(self) -> str | None:
         """Return the unique_id of the climate entity."""
@@ -19,20 +19,43 @@ from .const import (
     DOMAIN,
     CONF_HUB_ID,
     CONF_HUB_URL,
+    CONF_HUB_FAILOVER_URLS,
     CONF_HUB_USERNAME,
     CONF_HUB_PASSWORD,
     CONF_HUB_MANUFACTURER,
     CONF_HUB_MODEL,
     CONF_HUB_SCAN_INTERVAL,
+    CONF_HUB_PERSISTENT_SESSION,
+    CONF_HUB_SUBSCRIPTION,
+    CONF_HUB_WRITE_COALESCE,
+    CONF_NODE_BIT,
+    CONF_NODE_DEADBAND,
+    CONF_NODE_DEADBAND_PERCENT,
+    CONF_NODE_SCAN_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per-node scan interval in seconds, unset means the hub scan interval
+NODE_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.1))
+
+# Analog sensor deadbands, absolute units or percent of the node EURange
+NODE_DEADBAND_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0))
+NODE_DEADBAND_PERCENT_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
+
+# Bit of a packed UInt16/UInt32/UInt64 status word shown by a binary sensor
+NODE_BIT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0, max=63))
+
 # OPC-UA node ID pattern: ns=X;s=... or ns=X;i=...
 # Supports alphanumeric, underscores, hyphens, dots, colons, slashes, and square brackets (for array indexing)
 OPC_UA_NODE_ID_PATTERN = re.compile(r'^ns=\d+;[si]=[a-zA-Z0-9_\-\.:/\[\]]+$')
 
 
+def _split_urls(urls: str | None) -> list[str]:
+    """Return the standby endpoints entered comma separated."""
+    return [url.strip() for url in (urls or "").split(",") if url.strip()]
+
+
 def _validate_opc_ua_node_id(node_id: str) -> bool:
     """Validate OPC-UA node ID format."""
     return bool(OPC_UA_NODE_ID_PATTERN.match(node_id))
@@ -67,6 +90,9 @@ class AsyncuaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # Create the config entry with empty entity lists
                 entry_data = {
                     **user_input,
+                    CONF_HUB_FAILOVER_URLS: _split_urls(
+                        user_input.get(CONF_HUB_FAILOVER_URLS)
+                    ),
                     "sensors": [],
                     "binary_sensors": [],
                     "switches": [],
@@ -83,11 +109,15 @@ class AsyncuaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             {
                 vol.Required(CONF_HUB_ID, default="plc_15"): cv.string,
                 vol.Required(CONF_HUB_URL, default="opc.tcp://192.168.2.15:4840"): cv.string,
+                vol.Optional(CONF_HUB_FAILOVER_URLS): cv.string,
                 vol.Optional(CONF_HUB_MANUFACTURER, default=""): cv.string,
                 vol.Optional(CONF_HUB_MODEL, default=""): cv.string,
                 vol.Optional(CONF_HUB_USERNAME): cv.string,
                 vol.Optional(CONF_HUB_PASSWORD): cv.string,
                 vol.Optional(CONF_HUB_SCAN_INTERVAL, default=30): cv.positive_int,
+                vol.Optional(CONF_HUB_PERSISTENT_SESSION, default=True): cv.boolean,
+                vol.Optional(CONF_HUB_SUBSCRIPTION, default=False): cv.boolean,
+                vol.Optional(CONF_HUB_WRITE_COALESCE): cv.positive_int,
             }
         )
 
@@ -102,8 +132,16 @@ class AsyncuaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _async_validate_input(self, user_input: dict[str, Any]) -> None:
         """Validate the user input allows us to connect."""
+        for url in [
+            user_input[CONF_HUB_URL],
+            *_split_urls(user_input.get(CONF_HUB_FAILOVER_URLS)),
+        ]:
+            self._validate_url(url)
+
+    @staticmethod
+    def _validate_url(url: str) -> None:
+        """Check that an endpoint URL looks valid."""
         # Basic validation - just check if URL looks valid
-        url = user_input[CONF_HUB_URL]
         if not url.startswith("opc.tcp://"):
             raise CannotConnect("Invalid OPC-UA URL format")
 
@@ -188,7 +226,8 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                     hub=hub_id,
                     node_id=entity_data.get("nodeid"),
                     device_class=entity_data.get("device_class"),
-                    unique_id=entity_data.get("unique_id") or entity_data.get("nodeid"),
+                    unique_id=entity_data.get("unique_id"),
+                    bit=entity_data.get(CONF_NODE_BIT),
                 )
             elif entity_type == "switch":
                 from .switch import AsyncuaSwitch
@@ -237,12 +276,19 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                 _LOGGER.error(f"Unknown entity type: {entity_type}")
                 return False
             
+            # Update coordinator sensors list, switches are read from their DI node
+            # and lights and climates from their nodes, keyed by nodeid. A name
+            # already used on the hub is rejected before the entity is added.
+            if entity_type == "switch":
+                coordinator.add_sensors([entity.state_sensor])
+            elif entity_type in ("light", "climate"):
+                coordinator.add_sensors(entity.data_sensors)
+            else:
+                coordinator.add_sensors([entity_data])
+            
             # Add entity via callback
             callback([entity])
             
-            # Update coordinator sensors list
-            coordinator.add_sensors([entity_data])
-            
             return True
         except Exception as e:
             _LOGGER.error(f"Error adding entity dynamically: {e}", exc_info=True)
@@ -284,6 +330,9 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                     "device_class": user_input.get("device_class", ""),
                     "state_class": user_input.get("state_class", "measurement"),
                     "unit": user_input.get("unit", ""),
+                    CONF_NODE_SCAN_INTERVAL: user_input.get(CONF_NODE_SCAN_INTERVAL),
+                    CONF_NODE_DEADBAND: user_input.get(CONF_NODE_DEADBAND),
+                    CONF_NODE_DEADBAND_PERCENT: user_input.get(CONF_NODE_DEADBAND_PERCENT),
                 }
                 sensors = self._config_entry.data.get("sensors", [])
                 sensors.append(new_sensor)
@@ -307,6 +356,9 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional("device_class"): cv.string,
                 vol.Optional("state_class", default="measurement"): cv.string,
                 vol.Optional("unit"): cv.string,
+                vol.Optional(CONF_NODE_SCAN_INTERVAL): NODE_SCAN_INTERVAL_VALIDATOR,
+                vol.Optional(CONF_NODE_DEADBAND): NODE_DEADBAND_VALIDATOR,
+                vol.Optional(CONF_NODE_DEADBAND_PERCENT): NODE_DEADBAND_PERCENT_VALIDATOR,
             }
         )
 
@@ -336,6 +388,8 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                     "nodeid": user_input.get("nodeid"),
                     "device_class": user_input.get("device_class", ""),
                     "hub": self._config_entry.data.get("name"),
+                    CONF_NODE_BIT: user_input.get(CONF_NODE_BIT),
+                    CONF_NODE_SCAN_INTERVAL: user_input.get(CONF_NODE_SCAN_INTERVAL),
                 }
                 sensors = self._config_entry.data.get("binary_sensors", [])
                 sensors.append(new_sensor)
@@ -351,7 +405,9 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
             {
                 vol.Required("name"): cv.string,
                 vol.Required("nodeid"): cv.string,
+                vol.Optional(CONF_NODE_BIT): NODE_BIT_VALIDATOR,
                 vol.Optional("device_class"): cv.string,
+                vol.Optional(CONF_NODE_SCAN_INTERVAL): NODE_SCAN_INTERVAL_VALIDATOR,
             }
         )
         return self.async_show_form(
@@ -708,12 +764,17 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                         "device_class": user_input.get("device_class", ""),
                         "state_class": user_input.get("state_class", "measurement"),
                         "unit": user_input.get("unit", ""),
+                        CONF_NODE_SCAN_INTERVAL: user_input.get(CONF_NODE_SCAN_INTERVAL),
+                        CONF_NODE_DEADBAND: user_input.get(CONF_NODE_DEADBAND),
+                        CONF_NODE_DEADBAND_PERCENT: user_input.get(CONF_NODE_DEADBAND_PERCENT),
                     }
                 elif entity_type == "binary_sensor":
                     entities[entity_index] = {
                         "name": user_input.get("name"),
                         "nodeid": user_input.get("nodeid"),
                         "device_class": user_input.get("device_class", ""),
+                        CONF_NODE_BIT: user_input.get(CONF_NODE_BIT),
+                        CONF_NODE_SCAN_INTERVAL: user_input.get(CONF_NODE_SCAN_INTERVAL),
                     }
                 elif entity_type == "switch":
                     entities[entity_index] = {
@@ -764,6 +825,9 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional("device_class", default=current_entity.get("device_class", "")): cv.string,
                     vol.Optional("state_class", default=current_entity.get("state_class", "measurement")): cv.string,
                     vol.Optional("unit", default=current_entity.get("unit", "")): cv.string,
+                    vol.Optional(CONF_NODE_SCAN_INTERVAL, description={"suggested_value": current_entity.get(CONF_NODE_SCAN_INTERVAL)}): NODE_SCAN_INTERVAL_VALIDATOR,
+                    vol.Optional(CONF_NODE_DEADBAND, description={"suggested_value": current_entity.get(CONF_NODE_DEADBAND)}): NODE_DEADBAND_VALIDATOR,
+                    vol.Optional(CONF_NODE_DEADBAND_PERCENT, description={"suggested_value": current_entity.get(CONF_NODE_DEADBAND_PERCENT)}): NODE_DEADBAND_PERCENT_VALIDATOR,
                 }
             )
         elif entity_type == "binary_sensor":
@@ -771,7 +835,9 @@ class AsyncuaOptionsFlow(config_entries.OptionsFlow):
                 {
                     vol.Required("name", default=current_entity.get("name")): cv.string,
                     vol.Required("nodeid", default=current_entity.get("nodeid")): cv.string,
+                    vol.Optional(CONF_NODE_BIT, description={"suggested_value": current_entity.get(CONF_NODE_BIT)}): NODE_BIT_VALIDATOR,
                     vol.Optional("device_class", default=current_entity.get("device_class", "")): cv.string,
+                    vol.Optional(CONF_NODE_SCAN_INTERVAL, description={"suggested_value": current_entity.get(CONF_NODE_SCAN_INTERVAL)}): NODE_SCAN_INTERVAL_VALIDATOR,
                 }
             )
         elif entity_type == "switch":
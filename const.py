@@ -10,13 +10,52 @@ CONF_HUB_SCAN_INTERVAL = "scan_interval"
 CONF_HUB_URL = "url"
 CONF_HUB_USERNAME = "username"
 CONF_HUB_PASSWORD = "password"
+CONF_HUB_PERSISTENT_SESSION = "persistent_session"
+CONF_HUB_SUBSCRIPTION = "subscription"
+CONF_HUB_WRITE_COALESCE = "write_coalesce_ms"
+CONF_HUB_FAILOVER_URLS = "failover_urls"
+
+"""Publishing interval (ms) of the data change subscription"""
+DEFAULT_PUBLISHING_INTERVAL = 500
+
+"""Read chunking when the server reports no OperationLimits"""
+DEFAULT_MAX_NODES_PER_READ = 1000
+DEFAULT_READ_CONCURRENCY = 4
+
+"""Reconnect backoff: failed calls before the circuit opens, delays (s)"""
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_BACKOFF_INITIAL = 1
+DEFAULT_BACKOFF_MAX = 60
+
+"""Endpoint health checks (s), and the latency ratio a standby must beat"""
+DEFAULT_HEALTH_CHECK_INTERVAL = 10
+DEFAULT_LATENCY_PREFERENCE = 0.8
+
+"""History backfill after an outage: values per node and HistoryRead page,
+seconds to wait after the last hour of the outage for the recorder to compile it"""
+DEFAULT_HISTORY_PAGE_SIZE = 1000
+DEFAULT_BACKFILL_DELAY = 60
+
+"""Shortest coordinator tick (s); faster polling groups run on timers of their own"""
+MIN_COORDINATOR_INTERVAL = 1
+
+"""Seconds between reads of nodes quarantined after a bad StatusCode"""
+DEFAULT_QUARANTINE_RETRY = 60
+
+"""Writes waiting per non-stop priority lane before new ones are rejected"""
+DEFAULT_WRITE_QUEUE_DEPTH = 256
 
 """Constant required for opcua entities"""
 CONF_NODES = "nodes"
 CONF_NODE_DEVICE_CLASS = "device_class"
 CONF_NODE_HUB = "hub"
 CONF_NODE_ID = "nodeid"
+CONF_NODE_BIT = "bit"
+CONF_NODE_INDEX = "index"
 CONF_NODE_NAME = "name"
+CONF_NODE_SCAN_INTERVAL = "scan_interval"
+CONF_NODE_DEADBAND = "deadband"
+CONF_NODE_DEADBAND_PERCENT = "deadband_percent"
 CONF_NODE_STATE_CLASS = "state_class"
 CONF_NODE_UNIQUE_ID = "unique_id"
 CONF_NODE_UNIT_OF_MEASUREMENT = "unit_of_measurement"
@@ -28,6 +67,7 @@ CONF_NODE_SWITCH_DI = "nodeid_switch_di"
 ATTR_NODE_HUB = "hub"
 ATTR_NODE_ID = "nodeid"
 ATTR_VALUE = "value"
+ATTR_PRIORITY = "priority"
 SERVICE_SET_VALUE = "set_value"
 
 """Constants for cover entities"""
@@ -1,6 +1,7 @@
 """Platform for cover integration with Asyncua OPCUA nodes."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -20,14 +21,14 @@ from homeassistant.exceptions import ConfigEntryError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import PLATFORM_SCHEMA
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 from datetime import timedelta
 
-from . import AsyncuaCoordinator
+from . import AsyncuaCoordinator, WritePriority
 from .const import (
     CONF_NODE_HUB,
     CONF_NODE_ID,
@@ -43,12 +44,32 @@ from .const import (
     CONF_FULLY_OPEN_NODEID,
     CONF_FULLY_CLOSED_NODEID,
 )
-from .travelcalculator import TravelCalculator, TravelStatus
+from .travelcalculator import (
+    BankedTravelCalculator,
+    TravelCalculator,
+    TravelCalculatorBank,
+    TravelStatus,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TRAVEL_TIME = 25
 
+# Interval of the shared timer that refreshes the position of moving covers;
+# on a polled hub it also reads their limit switch nodes, stopped covers leave
+# them to the hub scan interval
+MOTION_TICK_INTERVAL = timedelta(milliseconds=250)
+
+# Covers of a hub from which on the calculator bank beats scalar calculators,
+# measured with benchmark_travelcalculator.py over a tick and its state writes:
+# the bank runs at 0.4x the scalar speed for 10 covers, 0.8x to 1.2x for 50,
+# 1.5x for 100 and 2.0x to 2.4x for 1000
+BANK_MIN_COVERS = 100
+
+# Int codes of the travel directions, compared in the cover state properties
+_DIRECTION_UP = TravelStatus.DIRECTION_UP.value
+_DIRECTION_DOWN = TravelStatus.DIRECTION_DOWN.value
+
 NODE_SCHEMA = {
     CONF_NODES: [
         {
@@ -129,7 +150,15 @@ async def async_setup_entry(
         )
 
     if entities:
+        coordinator.add_sensors(
+            [sensor for entity in entities for sensor in entity.limit_switch_sensors]
+        )
         async_add_entities(entities)
+        hass.async_create_task(
+            coordinator.hub.prefetch_variant_types(
+                [nodeid for entity in entities for nodeid in entity.command_nodeids]
+            )
+        )
 
     return True
 
@@ -180,7 +209,27 @@ async def async_setup_platform(
                 )
             )
 
+    for coordinator in coordinators.values():
+        coordinator.add_sensors(
+            [
+                sensor
+                for entity in asyncua_covers
+                if entity.coordinator is coordinator
+                for sensor in entity.limit_switch_sensors
+            ]
+        )
     async_add_entities(new_entities=asyncua_covers)
+    for coordinator in coordinators.values():
+        hass.async_create_task(
+            coordinator.hub.prefetch_variant_types(
+                [
+                    nodeid
+                    for entity in asyncua_covers
+                    if entity.coordinator is coordinator
+                    for nodeid in entity.command_nodeids
+                ]
+            )
+        )
 
     # Register cover services
     from homeassistant.helpers import entity_platform
@@ -205,6 +254,110 @@ async def async_setup_platform(
     )
 
 
+class CoverMotionScheduler:
+    """Refresh the position of all moving covers of one hub from one timer.
+
+    This only drives the state shown in Home Assistant; each cover stops
+    itself from a timer scheduled at its exact arrival time. While covers
+    move on a polled hub, their limit switches are also read together on
+    every tick, so an end stop is seen within MOTION_TICK_INTERVAL.
+    """
+
+    def __init__(self, coordinator: AsyncuaCoordinator) -> None:
+        """Initialize the scheduler."""
+        self._coordinator = coordinator
+        self._covers: dict[AsyncuaCover, int] = {}
+        self._unsubscribe_tick = None
+        self._limit_switch_read: asyncio.Task | None = None
+        self._calculators = 0
+        # Shared position arrays of the covers of a large hub, when numpy is available
+        self._bank: TravelCalculatorBank | None = None
+
+    @classmethod
+    def for_coordinator(cls, coordinator: AsyncuaCoordinator) -> CoverMotionScheduler:
+        """Return the scheduler shared by the covers of a coordinator."""
+        if not hasattr(coordinator, "_cover_motion_scheduler"):
+            coordinator._cover_motion_scheduler = cls(coordinator)
+        return coordinator._cover_motion_scheduler
+
+    def create_travel_calculator(
+        self, travel_time_down: int, travel_time_up: int
+    ) -> Any:
+        """Return a travel calculator for a cover of this hub.
+
+        The first covers get scalar calculators; once the hub has
+        BANK_MIN_COVERS, further covers get a row of the calculator bank.
+        """
+        self._calculators += 1
+        if (
+            self._bank is None
+            and self._calculators >= BANK_MIN_COVERS
+            and TravelCalculatorBank.available()
+        ):
+            self._bank = TravelCalculatorBank()
+        if self._bank is not None:
+            return self._bank.add(travel_time_down, travel_time_up)
+        return TravelCalculator(travel_time_down, travel_time_up)
+
+    def release_travel_calculator(self, travel_calculator: Any) -> None:
+        """Release the travel calculator of a removed cover."""
+        self._calculators -= 1
+        if isinstance(travel_calculator, BankedTravelCalculator):
+            self._bank.release(travel_calculator.row)
+
+    def add(self, cover: AsyncuaCover) -> None:
+        """Start ticking a cover, starting the timer if it is idle."""
+        self._covers.setdefault(cover, cover.current_cover_position)
+        if self._unsubscribe_tick is None:
+            _LOGGER.debug("Starting cover motion scheduler")
+            self._unsubscribe_tick = async_track_time_interval(
+                cover.hass, self._async_tick, MOTION_TICK_INTERVAL
+            )
+
+    def remove(self, cover: AsyncuaCover) -> None:
+        """Stop ticking a cover, stopping the timer once no cover moves."""
+        self._covers.pop(cover, None)
+        if not self._covers and self._unsubscribe_tick is not None:
+            _LOGGER.debug("Stopping cover motion scheduler")
+            self._unsubscribe_tick()
+            self._unsubscribe_tick = None
+
+    @callback
+    def _async_tick(self, now: Any) -> None:
+        """Update every moving cover and write state where the position moved.
+
+        The positions of banked covers are computed in one pass and read
+        back from it by the state writes of this tick.
+        """
+        if self._bank is not None:
+            self._bank.freeze()
+        try:
+            for cover in list(self._covers):
+                position = cover.current_cover_position
+                if position != self._covers.get(cover):
+                    self._covers[cover] = position
+                    cover.async_write_ha_state()
+                cover.auto_updater_hook(now)
+        finally:
+            if self._bank is not None:
+                self._bank.thaw()
+        self._read_limit_switches()
+
+    def _read_limit_switches(self) -> None:
+        """Read the limit switches of all moving covers in one batch."""
+        if self._coordinator.subscription or (
+            self._limit_switch_read is not None
+            and not self._limit_switch_read.done()
+        ):
+            return
+        keys = [key for cover in self._covers for key in cover.limit_switch_keys]
+        if not keys:
+            return
+        self._limit_switch_read = self._coordinator.hass.async_create_task(
+            self._coordinator.async_read_keys(keys)
+        )
+
+
 class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEntity):
     """A cover implementation for Asyncua OPCUA nodes."""
 
@@ -226,7 +379,7 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
         unique_id: str | None = None,
     ) -> None:
         """Initialize the cover."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, context=name)
         self._attr_name = name
         self._hub = hub
         self._node_id = node_id
@@ -243,15 +396,23 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
         self._stop_nodeid = stop_nodeid
         self._fully_open_nodeid = fully_open_nodeid
         self._fully_closed_nodeid = fully_closed_nodeid
+        # Coordinator data keys of the limit switch nodes
+        self._fully_open_key = f"{name}.fully_open" if fully_open_nodeid else None
+        self._fully_closed_key = (
+            f"{name}.fully_closed" if fully_closed_nodeid else None
+        )
         self._target_position = 50
-        self._unsubscribe_auto_updater = None
+        self._motion_scheduler = CoverMotionScheduler.for_coordinator(coordinator)
+        self._unsubscribe_arrival = None
         
         # Track active command to keep signal high during travel
         self._active_command = None  # "open", "close", or None
         self._command_started = False
 
-        # Travel calculator
-        self.tc = TravelCalculator(self._travel_time_down, self._travel_time_up)
+        # Travel calculator, a row of the hub's calculator bank when available
+        self.tc = self._motion_scheduler.create_travel_calculator(
+            self._travel_time_down, self._travel_time_up
+        )
 
     async def async_added_to_hass(self):
         """Restore cover position from last state."""
@@ -269,47 +430,77 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
         ):
             self.tc.set_position(int(old_state.attributes.get(ATTR_CURRENT_POSITION)))
 
-    async def _check_limit_switches(self) -> None:
-        """Check limit switches and update position if activated."""
-        if self._fully_open_nodeid:
-            try:
-                fully_open_state = await self.coordinator.hub.get_value(
-                    nodeid=self._fully_open_nodeid
-                )
-                if fully_open_state:
-                    _LOGGER.debug(
-                        "%s: Fully open sensor activated, setting position to 100",
-                        self._attr_name,
+        for key in (self._fully_open_key, self._fully_closed_key):
+            if key is not None:
+                self.async_on_remove(
+                    self.coordinator.async_add_listener(
+                        self._handle_limit_switch_update, key
                     )
-                    self.tc.set_position(100)
-                    self._handle_stop()
-                    return
-            except Exception as e:
-                _LOGGER.debug(
-                    "%s: Error reading fully_open sensor: %s",
-                    self._attr_name,
-                    e,
                 )
 
-        if self._fully_closed_nodeid:
-            try:
-                fully_closed_state = await self.coordinator.hub.get_value(
-                    nodeid=self._fully_closed_nodeid
-                )
-                if fully_closed_state:
-                    _LOGGER.debug(
-                        "%s: Fully closed sensor activated, setting position to 0",
-                        self._attr_name,
-                    )
-                    self.tc.set_position(0)
-                    self._handle_stop()
-                    return
-            except Exception as e:
-                _LOGGER.debug(
-                    "%s: Error reading fully_closed sensor: %s",
-                    self._attr_name,
-                    e,
-                )
+    async def async_will_remove_from_hass(self) -> None:
+        """Release the motion scheduler when the cover is removed."""
+        self._motion_scheduler.remove(self)
+        self._cancel_arrival()
+        self._motion_scheduler.release_travel_calculator(self.tc)
+        await super().async_will_remove_from_hass()
+
+    @property
+    def limit_switch_keys(self) -> list[str]:
+        """Return the coordinator data keys of the limit switches."""
+        return [
+            key
+            for key in (self._fully_open_key, self._fully_closed_key)
+            if key is not None
+        ]
+
+    @property
+    def limit_switch_sensors(self) -> list[dict[str, Any]]:
+        """Return the limit switch nodes to read through the coordinator."""
+        return [
+            {CONF_NODE_NAME: key, CONF_NODE_ID: nodeid}
+            for key, nodeid in (
+                (self._fully_open_key, self._fully_open_nodeid),
+                (self._fully_closed_key, self._fully_closed_nodeid),
+            )
+            if key is not None
+        ]
+
+    @callback
+    def _handle_limit_switch_update(self) -> None:
+        """Stop at the end position when a limit switch becomes active.
+
+        The switch the cover is moving away from is ignored, since it stays
+        active until the cover has left the end position.
+        """
+        data = self.coordinator.data or {}
+        if (
+            self._fully_open_key is not None
+            and data.get(self._fully_open_key)
+            and not self.is_closing
+        ):
+            _LOGGER.debug(
+                "%s: Fully open sensor activated, setting position to 100",
+                self._attr_name,
+            )
+            self._handle_limit_reached(100)
+        elif (
+            self._fully_closed_key is not None
+            and data.get(self._fully_closed_key)
+            and not self.is_opening
+        ):
+            _LOGGER.debug(
+                "%s: Fully closed sensor activated, setting position to 0",
+                self._attr_name,
+            )
+            self._handle_limit_reached(0)
+
+    @callback
+    def _handle_limit_reached(self, position: int) -> None:
+        """Confirm the end position and release the active command."""
+        self.tc.set_position(position)
+        self.stop_auto_updater()
+        self.async_write_ha_state()
 
     @property
     def unique_id(self) -> str | None:
@@ -331,6 +522,15 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
         """Return the node address provided by the OPCUA server."""
         return self._node_id
 
+    @property
+    def command_nodeids(self) -> list[str]:
+        """Return the nodes written by the cover commands."""
+        return [
+            nodeid
+            for nodeid in (self._open_nodeid, self._close_nodeid, self._stop_nodeid)
+            if nodeid
+        ]
+
     @property
     def supported_features(self) -> CoverEntityFeature:
         """Return the supported features of the cover."""
@@ -350,16 +550,16 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
     def is_opening(self) -> bool:
         """Return if the cover is opening or not."""
         return (
-            self.tc.is_traveling()
-            and self.tc.travel_direction == TravelStatus.DIRECTION_UP
+            self.tc.travel_direction_code == _DIRECTION_UP
+            and self.tc.is_traveling()
         )
 
     @property
     def is_closing(self) -> bool:
         """Return if the cover is closing or not."""
         return (
-            self.tc.is_traveling()
-            and self.tc.travel_direction == TravelStatus.DIRECTION_DOWN
+            self.tc.travel_direction_code == _DIRECTION_DOWN
+            and self.tc.is_traveling()
         )
 
     @property
@@ -417,18 +617,42 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
             self.stop_auto_updater()
 
     def start_auto_updater(self) -> None:
-        """Start the autoupdater to update HA while cover is moving."""
+        """Hand the cover to the hub motion scheduler and time its arrival."""
         _LOGGER.debug("%s: start_auto_updater", self._attr_name)
-        if self._unsubscribe_auto_updater is None:
-            _LOGGER.debug("%s: Initializing auto updater", self._attr_name)
-            interval = timedelta(milliseconds=100)
-            self._unsubscribe_auto_updater = async_track_time_interval(
-                self.hass, self.auto_updater_hook, interval
+        self._motion_scheduler.add(self)
+        self._schedule_arrival()
+
+    def _schedule_arrival(self) -> None:
+        """Schedule the stop for the moment the cover reaches its target."""
+        self._cancel_arrival()
+        delay = self.tc.time_to_arrival()
+        if delay is not None:
+            _LOGGER.debug("%s: Arrival in %.3f s", self._attr_name, delay)
+            self._unsubscribe_arrival = async_call_later(
+                self.hass, delay, self._handle_arrival
             )
 
+    def _cancel_arrival(self) -> None:
+        """Cancel a scheduled arrival."""
+        if self._unsubscribe_arrival is not None:
+            self._unsubscribe_arrival()
+            self._unsubscribe_arrival = None
+
+    @callback
+    def _handle_arrival(self, now: Any) -> None:
+        """Stop the cover once it has reached its target position."""
+        self._unsubscribe_arrival = None
+        if not self.position_reached():
+            # The timer fired marginally early
+            self._schedule_arrival()
+            return
+        _LOGGER.debug("%s: Position reached, stopping updater", self._attr_name)
+        self.stop_auto_updater()
+        self.async_write_ha_state()
+
     @callback
     def auto_updater_hook(self, now: Any) -> None:
-        """Call for the autoupdater."""
+        """Call for the autoupdater on each tick of the motion scheduler."""
         _LOGGER.debug(
             "%s: auto_updater_hook - position: %d, target: %d",
             self._attr_name,
@@ -444,22 +668,12 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
                 self._active_command,
             )
             self._command_started = True
-        
-        # Check limit switches asynchronously
-        self.hass.async_create_task(self._check_limit_switches())
-        
-        self.async_write_ha_state()
-        
-        if self.position_reached():
-            _LOGGER.debug("%s: Position reached, stopping updater", self._attr_name)
-            self.stop_auto_updater()
 
     def stop_auto_updater(self) -> None:
         """Stop the autoupdater and deactivate command signals."""
         _LOGGER.debug("%s: stop_auto_updater", self._attr_name)
-        if self._unsubscribe_auto_updater is not None:
-            self._unsubscribe_auto_updater()
-            self._unsubscribe_auto_updater = None
+        self._motion_scheduler.remove(self)
+        self._cancel_arrival()
         
         # Deactivate command signals
         if self._active_command:
@@ -545,16 +759,19 @@ class AsyncuaCover(CoordinatorEntity[AsyncuaCoordinator], CoverEntity, RestoreEn
                 cmd_name,
                 nodeid,
             )
-            await self.coordinator.hub.set_value(nodeid=nodeid, value=False)
-            
-            # Also send to STOP node if available
+            values = {nodeid: False}
+
+            # Also send to STOP node if available, in the same Write request
             if self._stop_nodeid:
                 _LOGGER.debug(
                     "%s: Sending STOP signal to node %s (value=True)",
                     self._attr_name,
                     self._stop_nodeid,
                 )
-                await self.coordinator.hub.set_value(nodeid=self._stop_nodeid, value=True)
+                values[self._stop_nodeid] = True
+            await self.coordinator.hub.set_values(
+                values, priority=WritePriority.STOP
+            )
         except Exception as e:
             _LOGGER.error(
                 "%s: Error stopping command: %s",
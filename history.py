@@ -0,0 +1,95 @@
+"""
+Module HourlyMean turns a stream of historical samples into hourly statistics.
+
+Samples read back from the OPC UA server after an outage arrive page by
+page, in time order. Each sample holds its value until the next one, so
+the mean of an hour is weighted by how long every value was held, the way
+Home Assistant compiles statistics of measurement sensors.
+
+E.g.:
+
+* Value 10 at 12:00, value 20 at 12:15 and nothing else until 13:00.
+* The 12:00 hour gets min 10, max 20 and mean 17.5.
+* The 13:00 hour starts at 20, the value still held.
+"""
+from datetime import datetime, timedelta
+
+HOUR = timedelta(hours=1)
+
+
+def floor_hour(moment: datetime) -> datetime:
+    """Return the start of the hour of moment."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_hour(moment: datetime) -> datetime:
+    """Return the end of the hour of moment, or moment on a whole hour."""
+    start = floor_hour(moment)
+    return start if start == moment else start + HOUR
+
+
+class HourlyMean:
+    """Time weighted mean, min and max of one node, closed hour by hour."""
+
+    __slots__ = ("_hour", "_time", "_value", "_area", "_duration", "_min", "_max")
+
+    def __init__(self, start: datetime):
+        """Initialize the accumulator at the whole hour start."""
+        self._hour = start
+        self._time = start
+        self._value: float | None = None
+        self._area = 0.0
+        self._duration = 0.0
+        self._min: float | None = None
+        self._max: float | None = None
+
+    def add(self, moment: datetime, value: float) -> list[dict]:
+        """Add a sample and return the hours it closed.
+
+        A sample older than the current hour, such as the bounding value at
+        the start of the read, is taken as the value held from there on.
+        """
+        moment = max(moment, self._time)
+        hours = []
+        while moment >= self._hour + HOUR:
+            hours.extend(self._close_hour())
+        self._integrate(moment)
+        self._value = value
+        self._min = value if self._min is None else min(self._min, value)
+        self._max = value if self._max is None else max(self._max, value)
+        return hours
+
+    def close(self, end: datetime) -> list[dict]:
+        """Close every hour up to end and return them."""
+        hours = []
+        while self._hour < end:
+            hours.extend(self._close_hour())
+        return hours
+
+    def _integrate(self, until: datetime) -> None:
+        """Add the value held since the last sample up to until."""
+        if self._value is not None:
+            seconds = (until - self._time).total_seconds()
+            self._area += self._value * seconds
+            self._duration += seconds
+        self._time = until
+
+    def _close_hour(self) -> list[dict]:
+        """Close the current hour, carrying the held value into the next."""
+        end = self._hour + HOUR
+        self._integrate(end)
+        hours = []
+        if self._duration > 0:
+            hours.append(
+                {
+                    "start": self._hour,
+                    "mean": self._area / self._duration,
+                    "min": self._min,
+                    "max": self._max,
+                }
+            )
+        self._hour = end
+        self._area = 0.0
+        self._duration = 0.0
+        self._min = self._max = self._value
+        return hours
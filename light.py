@@ -113,6 +113,9 @@ async def async_setup_entry(
         )
 
     if asyncua_lights:
+        coordinator.add_sensors(
+            [sensor for light in asyncua_lights for sensor in light.data_sensors]
+        )
         async_add_entities(new_entities=asyncua_lights)
 
     return True
@@ -152,6 +155,15 @@ async def async_setup_platform(
                     brightness_node_id=val_light.get("brightness_nodeid"),
                 )
             )
+    for coordinator in coordinators.values():
+        coordinator.add_sensors(
+            [
+                sensor
+                for light in asyncua_lights
+                if light.coordinator is coordinator
+                for sensor in light.data_sensors
+            ]
+        )
     async_add_entities(new_entities=asyncua_lights)
 
 
@@ -173,7 +185,7 @@ class AsyncuaLight(CoordinatorEntity[AsyncuaCoordinator], LightEntity):
         brightness_node_id: Union[str, None] = None,
     ) -> None:
         """Initialize the light entity."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, context=node_id)
 
         # Create entity description
         self.entity_description = AsyncuaLightEntityDescription(
@@ -200,6 +212,25 @@ class AsyncuaLight(CoordinatorEntity[AsyncuaCoordinator], LightEntity):
             self._attr_supported_color_modes = {ColorMode.ONOFF}
             self._attr_color_mode = ColorMode.ONOFF
 
+    async def async_added_to_hass(self) -> None:
+        """Also listen to the brightness node, the on/off node is the context."""
+        await super().async_added_to_hass()
+        if self._brightness_node_id:
+            self.async_on_remove(
+                self.coordinator.async_add_listener(
+                    self._handle_coordinator_update, self._brightness_node_id
+                )
+            )
+
+    @property
+    def data_sensors(self) -> list[dict[str, str]]:
+        """Return the nodes read through the coordinator, keyed by nodeid."""
+        return [
+            {CONF_NODE_NAME: nodeid, CONF_NODE_ID: nodeid}
+            for nodeid in (self._node_id, self._brightness_node_id)
+            if nodeid
+        ]
+
     @property
     def unique_id(self) -> str | None:
         """Return the unique_id of the light."""
@@ -7,7 +7,11 @@ from typing import Any, Union
 
 import voluptuous as vol
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError
@@ -24,10 +28,14 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from . import AsyncuaCoordinator
 from .const import (
     CONF_HUB_ID,
+    CONF_NODE_DEADBAND,
+    CONF_NODE_DEADBAND_PERCENT,
     CONF_NODE_DEVICE_CLASS,
     CONF_NODE_HUB,
     CONF_NODE_ID,
+    CONF_NODE_INDEX,
     CONF_NODE_NAME,
+    CONF_NODE_SCAN_INTERVAL,
     CONF_NODE_STATE_CLASS,
     CONF_NODE_UNIQUE_ID,
     CONF_NODE_UNIT_OF_MEASUREMENT,
@@ -45,8 +53,18 @@ NODE_SCHEMA = {
             vol.Optional(CONF_NODE_UNIT_OF_MEASUREMENT): cv.string,
             vol.Optional(CONF_NODE_UNIQUE_ID): cv.string,
             vol.Required(CONF_NODE_ID): cv.string,
+            vol.Optional(CONF_NODE_INDEX): cv.positive_int,
             vol.Required(CONF_NODE_NAME): cv.string,
             vol.Required(CONF_NODE_HUB): cv.string,
+            vol.Optional(CONF_NODE_SCAN_INTERVAL): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1)
+            ),
+            vol.Optional(CONF_NODE_DEADBAND): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(CONF_NODE_DEADBAND_PERCENT): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=100)
+            ),
         }
     ]
 }
@@ -192,7 +210,7 @@ class AsyncuaSensor(CoordinatorEntity[AsyncuaCoordinator], SensorEntity):
         unit_of_measurement: Union[str, None] = None,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, context=name)
         
         # Create entity description from provided parameters
         self.entity_description = AsyncuaSensorEntityDescription(
@@ -217,6 +235,11 @@ class AsyncuaSensor(CoordinatorEntity[AsyncuaCoordinator], SensorEntity):
             coordinator_data=coordinator.data
         )
 
+    @property
+    def available(self) -> bool:
+        """Return False while the node is quarantined after a bad read."""
+        return super().available and self.coordinator.key_available(self.entity_description.name)
+
     @property
     def unique_id(self) -> str | None:
         """Return the unique_id of the sensor."""
@@ -257,6 +280,18 @@ class AsyncuaSensor(CoordinatorEntity[AsyncuaCoordinator], SensorEntity):
         """Return the unit of measurement from entity description."""
         return self.entity_description.unit_of_measurement
 
+    async def async_added_to_hass(self) -> None:
+        """Have the statistics of a measurement backfilled after outages."""
+        await super().async_added_to_hass()
+        if self.state_class == SensorStateClass.MEASUREMENT:
+            self.async_on_remove(
+                self.coordinator.add_history_target(
+                    key=self.entity_description.name,
+                    entity_id=self.entity_id,
+                    unit=self.native_unit_of_measurement,
+                )
+            )
+
     def _parse_coordinator_data(
         self,
         coordinator_data: dict[str, Any],
@@ -15,11 +15,12 @@ from homeassistant.exceptions import ConfigEntryError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import PLATFORM_SCHEMA
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from . import AsyncuaCoordinator
+from . import AsyncuaCoordinator, WritePriority
 from .const import (
     CONF_NODE_HUB,
     CONF_NODE_ID,
@@ -32,6 +33,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Delay (s) after a write before the switch state is read back from its DI node
+SWITCH_CONFIRM_DELAY = 1
+
 NODE_SCHEMA = {
     CONF_NODES: [
         {
@@ -72,7 +76,6 @@ async def async_setup_entry(
     if not switches_cfg:
         return
 
-    coordinator.add_sensors(switches_cfg)
     entities: list[AsyncuaSwitch] = []
     for sw in switches_cfg:
         entities.append(
@@ -87,7 +90,17 @@ async def async_setup_entry(
         )
 
     if entities:
+        coordinator.add_sensors([entity.state_sensor for entity in entities])
         async_add_entities(entities)
+        hass.async_create_task(
+            coordinator.hub.prefetch_variant_types(
+                [entity.node_id for entity in entities]
+            )
+        )
+        if not coordinator.subscription:
+            hass.async_create_task(
+                coordinator.async_read_keys([entity.attr_name for entity in entities])
+            )
 
     return True
 
@@ -116,7 +129,6 @@ async def async_setup_platform(
                 f"Asyncua hub {key_coordinator} not found. Specify a valid asyncua hub in the configuration."
             )
         coordinators[key_coordinator] = hass.data[DOMAIN][key_coordinator]
-        coordinators[key_coordinator].add_sensors(sensors=val_coordinator)
 
         for _idx_sensor, val_sensor in enumerate(val_coordinator):
             asyncua_switches.append(
@@ -129,10 +141,32 @@ async def async_setup_platform(
                     unique_id=val_sensor.get(CONF_NODE_UNIQUE_ID),
                 )
             )
+        hass.async_create_task(
+            coordinators[key_coordinator].hub.prefetch_variant_types(
+                [val_sensor[CONF_NODE_ID] for val_sensor in val_coordinator]
+            )
+        )
+    for coordinator in coordinators.values():
+        coordinator.add_sensors(
+            [
+                entity.state_sensor
+                for entity in asyncua_switches
+                if entity.coordinator is coordinator
+            ]
+        )
     async_add_entities(asyncua_switches)
-    for idx_switch, val_switch in enumerate(asyncua_switches):
-        await val_switch.async_init()
-        _LOGGER.debug("Initialized switch %s - %s", idx_switch, val_switch.attr_name)
+    # Initialize all switches of a hub with one batched read of their DI nodes,
+    # a subscription pushes their initial values instead
+    for coordinator in coordinators.values():
+        if coordinator.subscription:
+            continue
+        await coordinator.async_read_keys(
+            [
+                entity.attr_name
+                for entity in asyncua_switches
+                if entity.coordinator is coordinator
+            ]
+        )
 
 
 class AsyncuaSwitch(SwitchEntity, CoordinatorEntity[AsyncuaCoordinator]):
@@ -150,7 +184,7 @@ class AsyncuaSwitch(SwitchEntity, CoordinatorEntity[AsyncuaCoordinator]):
         unique_id: str | None = None,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, context=name)
         self._attr_name = name
         self._hub = hub
         self._node_id = node_id
@@ -164,13 +198,31 @@ class AsyncuaSwitch(SwitchEntity, CoordinatorEntity[AsyncuaCoordinator]):
         self._hub = hub
         self._coordinator = coordinator
         self._node_id = node_id
-        self._addr_di = addr_di if addr_di is not None else node_id
+        self._addr_di = addr_di or node_id
+        # Commanded state shown until the DI node confirms it
+        self._pending_state: bool | None = None
+        self._unsubscribe_confirm = None
 
     @property
     def attr_name(self):
         """Return __attr_name variable."""
         return self._attr_name
 
+    @property
+    def available(self) -> bool:
+        """Return False while the node is quarantined after a bad read."""
+        return super().available and self.coordinator.key_available(self._attr_name)
+
+    @property
+    def node_id(self) -> str:
+        """Return the node address written by the switch."""
+        return self._node_id
+
+    @property
+    def state_sensor(self) -> dict[str, str]:
+        """Return the DI node read through the coordinator for the switch state."""
+        return {CONF_NODE_NAME: self._attr_name, CONF_NODE_ID: self._addr_di}
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this entity."""
@@ -190,34 +242,67 @@ class AsyncuaSwitch(SwitchEntity, CoordinatorEntity[AsyncuaCoordinator]):
             self._available = STATE_UNAVAILABLE
             return self._attr_is_on
         # Return node state and set availability to OK
-        self._attr_is_on = self.coordinator.hub.cache_val.get(
-            self._attr_unique_id, None
-        )
+        if self._pending_state is not None:
+            self._attr_is_on = self._pending_state
+        else:
+            self._attr_is_on = (self.coordinator.data or {}).get(self._attr_name)
         self._attr_available = STATE_OK
         self._available = STATE_OK
         return self._attr_is_on
 
-    async def async_init(self) -> None:
-        """Initialize switch to get latest value."""
-        await self._async_set_value()
-
-    async def _async_set_value(self, val: bool = None, **kwargs) -> None:
-        """Set boolean value to node then execute refresh to get updated DI value."""
-        if val is not None:
-            await self.coordinator.hub.set_value(
-                nodeid=self._node_id,
-                value=val,
-                **kwargs,
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending state confirmation."""
+        self._cancel_confirm()
+        await super().async_will_remove_from_hass()
+
+    async def _async_set_value(
+        self, val: bool, priority: WritePriority = WritePriority.INTERACTIVE
+    ) -> None:
+        """Write the command, show it optimistically and confirm it later.
+
+        The DI node alone is read back after SWITCH_CONFIRM_DELAY, or taken
+        from the subscription when the hub is subscribed.
+        """
+        if not await self.coordinator.hub.set_value(
+            nodeid=self._node_id,
+            value=val,
+            priority=priority,
+        ):
+            return
+        self._pending_state = val
+        self.async_write_ha_state()
+        self._cancel_confirm()
+        self._unsubscribe_confirm = async_call_later(
+            self.hass, SWITCH_CONFIRM_DELAY, self._async_confirm_state
+        )
+
+    async def _async_confirm_state(self, _now: Any) -> None:
+        """Replace the commanded state by the one reported by the DI node."""
+        self._unsubscribe_confirm = None
+        if not self.coordinator.subscription:
+            await self.coordinator.async_read_keys([self._attr_name])
+        confirmed = (self.coordinator.data or {}).get(self._attr_name)
+        if confirmed is not None and bool(confirmed) != self._pending_state:
+            _LOGGER.warning(
+                "%s: %s reports %s after the switch was set to %s",
+                self._attr_name,
+                self._addr_di,
+                confirmed,
+                self._pending_state,
             )
-        new_val = await self.coordinator.hub.get_value(nodeid=self._addr_di)
-        self._attr_is_on = new_val
-        self._attr_available = True
-        await self.coordinator.async_refresh()
+        self._pending_state = None
+        self.async_write_ha_state()
+
+    def _cancel_confirm(self) -> None:
+        """Cancel a scheduled state confirmation."""
+        if self._unsubscribe_confirm is not None:
+            self._unsubscribe_confirm()
+            self._unsubscribe_confirm = None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         await self._async_set_value(val=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the entity off."""
-        await self._async_set_value(val=False)
+        """Turn the entity off, ahead of queued interactive and background writes."""
+        await self._async_set_value(val=False, priority=WritePriority.STOP)
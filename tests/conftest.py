@@ -0,0 +1,82 @@
+"""Shared setup of the asyncua integration tests.
+
+The repository is the integration itself, so it is imported the way Home
+Assistant loads it, as custom_components.asyncua. The modules that do not
+depend on Home Assistant are also importable on their own, by file name.
+"""
+import asyncio
+import importlib.util
+import sys
+import types
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = "custom_components.asyncua"
+
+sys.path.insert(0, str(ROOT))
+
+
+def _load_integration() -> None:
+    """Import the repository as custom_components.asyncua."""
+    if INTEGRATION in sys.modules:
+        return
+    custom_components = sys.modules.setdefault(
+        "custom_components", types.ModuleType("custom_components")
+    )
+    custom_components.__path__ = []
+    spec = importlib.util.spec_from_file_location(
+        INTEGRATION, ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[INTEGRATION] = module
+    try:
+        spec.loader.exec_module(module)
+    except ImportError:
+        # Home Assistant or asyncua missing, the tests needing them skip
+        del sys.modules[INTEGRATION]
+
+
+_load_integration()
+
+
+@pytest.fixture
+def hass(tmp_path):
+    """Return a Home Assistant instance on an event loop of its own.
+
+    Coroutines are run with hass.loop.run_until_complete.
+    """
+    core = pytest.importorskip("homeassistant.core")
+    loop = asyncio.new_event_loop()
+
+    async def create():
+        return core.HomeAssistant(str(tmp_path))
+
+    instance = loop.run_until_complete(create())
+    yield instance
+    loop.run_until_complete(instance.async_stop(force=True))
+    loop.close()
+
+
+@pytest.fixture
+def coordinator(hass):
+    """Return a factory of coordinators on a hub that never connects."""
+    integration = pytest.importorskip(INTEGRATION)
+    coordinators = []
+
+    def create(sensors, scan_interval=10, subscription=False):
+        hub = integration.OpcuaHub(
+            "hub", "manufacturer", "model", "opc.tcp://127.0.0.1:4840"
+        )
+        instance = integration.AsyncuaCoordinator(
+            hass, "hub", hub, timedelta(seconds=scan_interval), subscription
+        )
+        instance.add_sensors(sensors)
+        coordinators.append(instance)
+        return instance
+
+    yield create
+    for instance in coordinators:
+        instance._cancel_fast_groups()
@@ -0,0 +1,71 @@
+"""Tests of fanning array node reads out to element keys."""
+import pytest
+
+pytest.importorskip("custom_components.asyncua")
+
+ARRAY = "ns=2;i=2"
+
+
+def test_elements_read_through_covering_range(coordinator):
+    """Element keys read the smallest IndexRange covering them, once."""
+    instance = coordinator(
+        [
+            {"name": "element2", "nodeid": f"{ARRAY}[2]"},
+            {"name": "element4", "nodeid": ARRAY, "index": 4},
+            {"name": "element4_again", "nodeid": "ns=2;i=0002[4]"},
+        ]
+    )
+
+    assert instance._index_ranges == {ARRAY: "2:4"}
+    assert instance._read_pairs(instance.node_key_pair) == {ARRAY: ARRAY}
+    assert instance._unpack({ARRAY: [20, 30, 40]}) == {
+        "element2": 20,
+        "element4": 40,
+        "element4_again": 40,
+    }
+
+
+def test_single_element_range(coordinator):
+    """One element is read with a single index range."""
+    instance = coordinator([{"name": "element3", "nodeid": f"{ARRAY}[3]"}])
+
+    assert instance._index_ranges == {ARRAY: "3"}
+    assert instance._unpack({ARRAY: [30]}) == {"element3": 30}
+
+
+def test_array_also_read_whole(coordinator):
+    """An array used whole by another key is read whole, elements from there."""
+    instance = coordinator(
+        [
+            {"name": "array", "nodeid": ARRAY},
+            {"name": "element1", "nodeid": f"{ARRAY}[1]"},
+        ]
+    )
+
+    assert instance._index_ranges == {}
+    assert instance._unpack({ARRAY: [0, 10, 20]}) == {
+        "array": [0, 10, 20],
+        "element1": 10,
+    }
+
+
+def test_short_or_scalar_reads(coordinator):
+    """Elements past a short array read None, a scalar leaves them out."""
+    instance = coordinator(
+        [
+            {"name": "element0", "nodeid": f"{ARRAY}[0]"},
+            {"name": "element5", "nodeid": f"{ARRAY}[5]"},
+        ]
+    )
+
+    assert instance._unpack({ARRAY: [1, 2]}) == {"element0": 1, "element5": None}
+    assert instance._unpack({ARRAY: 7}) == {}
+    assert instance._unpack({}) == {}
+
+
+def test_pushed_value_holds_whole_array(coordinator):
+    """Pushed and historical values index the full array, not the range."""
+    instance = coordinator([{"name": "element2", "nodeid": f"{ARRAY}[2]"}])
+
+    assert instance._unpack_value("element2", [0, 10, 20]) == 20
+    assert instance._unpack_value("element2", [0]) is None
@@ -0,0 +1,83 @@
+"""Tests of unpacking status word bits into binary sensor keys."""
+import pytest
+
+integration = pytest.importorskip("custom_components.asyncua")
+
+WORD = "ns=2;i=1"
+ARRAY = "ns=2;i=2"
+
+
+@pytest.fixture(params=["numpy", "python"])
+def unpack_path(request, monkeypatch):
+    """Run each test with the vectorized and the pure Python unpacking."""
+    if request.param == "python":
+        monkeypatch.setattr(integration, "np", None)
+    elif integration.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+def test_bits_and_whole_word_from_one_read(coordinator, unpack_path):
+    """Every bit key and the key on the whole word share one value read."""
+    instance = coordinator(
+        [
+            {"name": "word", "nodeid": WORD},
+            {"name": "bit0", "nodeid": WORD, "bit": 0},
+            {"name": "bit1", "nodeid": WORD, "bit": 1},
+            {"name": "bit63", "nodeid": WORD, "bit": 63},
+        ]
+    )
+
+    assert instance._read_pairs(instance.node_key_pair) == {WORD: WORD}
+    assert instance._unpack({WORD: 1 | 1 << 63}) == {
+        "word": 1 | 1 << 63,
+        "bit0": True,
+        "bit1": False,
+        "bit63": True,
+    }
+
+
+def test_negative_word_unpacks_twos_complement(coordinator, unpack_path):
+    """A signed word read negative has its sign bits set."""
+    instance = coordinator([{"name": "bit15", "nodeid": WORD, "bit": 15}])
+
+    assert instance._unpack({WORD: -1}) == {"bit15": True}
+
+
+def test_bits_of_unreadable_word_are_left_out(coordinator, unpack_path):
+    """Bits of a word missing or not a number keep their previous value."""
+    instance = coordinator(
+        [
+            {"name": "bit0", "nodeid": WORD, "bit": 0},
+            {"name": "other", "nodeid": "ns=2;i=3", "bit": 0},
+        ]
+    )
+
+    assert instance._unpack({WORD: None, "ns=2;i=3": 1}) == {"other": True}
+    assert instance._unpack({WORD: "bad"}) == {}
+
+
+def test_bits_of_array_elements(coordinator, unpack_path):
+    """A bit of an array element is taken from the element read."""
+    instance = coordinator(
+        [
+            {"name": "element1", "nodeid": f"{ARRAY}[1]"},
+            {"name": "element3_bit2", "nodeid": ARRAY, "index": 3, "bit": 2},
+        ]
+    )
+
+    assert instance._index_ranges == {ARRAY: "1:3"}
+    assert instance._unpack({ARRAY: [7, 0, 4]}) == {
+        "element1": 7,
+        "element3_bit2": True,
+    }
+
+
+def test_bit_plan_rebuilt_when_sensors_added(coordinator, unpack_path):
+    """Bit sensors added later are part of the next unpack."""
+    instance = coordinator([{"name": "bit0", "nodeid": WORD, "bit": 0}])
+    instance._unpack({WORD: 1})
+
+    instance.add_sensors([{"name": "bit1", "nodeid": WORD, "bit": 1}])
+
+    assert instance._unpack({WORD: 2}) == {"bit0": False, "bit1": True}
@@ -0,0 +1,67 @@
+"""Tests of the hourly statistics compiled from history samples."""
+from datetime import datetime, timedelta, timezone
+
+from history import HourlyMean, ceil_hour, floor_hour
+
+NOON = datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+
+
+def test_floor_and_ceil_hour():
+    """Moments round to their hour, whole hours stay put."""
+    moment = NOON + timedelta(minutes=15, seconds=3)
+
+    assert floor_hour(moment) == NOON
+    assert ceil_hour(moment) == NOON + timedelta(hours=1)
+    assert ceil_hour(NOON) == NOON
+
+
+def test_mean_weighted_by_hold_time():
+    """Each value counts for as long as it was held."""
+    mean = HourlyMean(NOON)
+
+    assert mean.add(NOON, 10) == []
+    assert mean.add(NOON + timedelta(minutes=15), 20) == []
+    assert mean.close(NOON + timedelta(hours=1)) == [
+        {"start": NOON, "mean": 17.5, "min": 10, "max": 20}
+    ]
+
+
+def test_value_carried_into_next_hours():
+    """A value held over hour boundaries opens every hour it spans."""
+    mean = HourlyMean(NOON)
+    mean.add(NOON + timedelta(minutes=30), 10)
+
+    hours = mean.add(NOON + timedelta(hours=2, minutes=30), 30)
+    hours.extend(mean.close(NOON + timedelta(hours=3)))
+
+    assert hours == [
+        {"start": NOON, "mean": 10, "min": 10, "max": 10},
+        {"start": NOON + timedelta(hours=1), "mean": 10, "min": 10, "max": 10},
+        {"start": NOON + timedelta(hours=2), "mean": 20, "min": 10, "max": 30},
+    ]
+
+
+def test_bounding_sample_held_from_start():
+    """A sample older than the start is the value held from the start on."""
+    mean = HourlyMean(NOON)
+    mean.add(NOON - timedelta(minutes=40), 4)
+    mean.add(NOON + timedelta(minutes=30), 8)
+
+    assert mean.close(NOON + timedelta(hours=1)) == [
+        {"start": NOON, "mean": 6, "min": 4, "max": 8}
+    ]
+
+
+def test_hours_without_value_are_skipped():
+    """Nothing is compiled before the first sample."""
+    mean = HourlyMean(NOON)
+
+    assert mean.close(NOON + timedelta(hours=2)) == []
+
+    mean = HourlyMean(NOON)
+    hours = mean.add(NOON + timedelta(hours=1, minutes=45), 2)
+    hours.extend(mean.close(NOON + timedelta(hours=2)))
+
+    assert hours == [
+        {"start": NOON + timedelta(hours=1), "mean": 2, "min": 2, "max": 2}
+    ]
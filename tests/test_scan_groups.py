@@ -0,0 +1,117 @@
+"""Tests of the polling groups of AsyncuaCoordinator."""
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("custom_components.asyncua")
+
+
+def test_shared_node_polled_once_at_fastest_interval(coordinator):
+    """A node of several keys is read once, in the group of the fastest key."""
+    instance = coordinator(
+        [
+            {"name": "slow", "nodeid": "ns=2;i=0005", "scan_interval": 6},
+            {"name": "fast", "nodeid": "ns=2;i=5", "scan_interval": 2},
+            {"name": "other", "nodeid": "ns=2;i=6", "scan_interval": 6},
+        ]
+    )
+
+    assert instance._scan_groups == {
+        timedelta(seconds=2): {"ns=2;i=5": "ns=2;i=5"},
+        timedelta(seconds=6): {"ns=2;i=6": "ns=2;i=6"},
+    }
+    assert instance.update_interval == timedelta(seconds=2)
+
+
+def test_tick_is_gcd_of_groups(coordinator):
+    """The coordinator ticks at the greatest common divisor of its groups."""
+    instance = coordinator(
+        [
+            {"name": "a", "nodeid": "ns=2;i=1", "scan_interval": 4},
+            {"name": "b", "nodeid": "ns=2;i=2", "scan_interval": 6},
+        ]
+    )
+
+    assert instance.update_interval == timedelta(seconds=2)
+
+
+def test_sub_second_groups_get_timers(coordinator):
+    """Groups faster than a second poll from timers, the tick stays at 1 s."""
+    instance = coordinator(
+        [
+            {"name": "fast", "nodeid": "ns=2;i=1", "scan_interval": 0.25},
+            {"name": "slow", "nodeid": "ns=2;i=2", "scan_interval": 1.5},
+        ]
+    )
+
+    assert instance._fast_groups == {
+        timedelta(milliseconds=250): {"ns=2;i=1": "ns=2;i=1"}
+    }
+    assert set(instance._fast_timers) == {timedelta(milliseconds=250)}
+    assert instance._scan_groups == {
+        timedelta(seconds=1.5): {"ns=2;i=2": "ns=2;i=2"}
+    }
+    assert instance.update_interval == timedelta(seconds=1.5)
+
+    instance.add_sensors([{"name": "slower", "nodeid": "ns=2;i=3", "scan_interval": 2}])
+
+    assert instance.update_interval == timedelta(seconds=1)
+
+
+def test_fast_group_timer_stops_when_group_leaves(coordinator):
+    """A fast group whose node is quarantined loses its timer."""
+    instance = coordinator(
+        [{"name": "fast", "nodeid": "ns=2;i=1", "scan_interval": 0.5}]
+    )
+    instance._quarantine["ns=2;i=1"] = 0.0
+    instance._update_scan_groups()
+
+    assert instance._fast_groups == {}
+    assert instance._fast_timers == {}
+
+
+def test_subscription_keeps_tick_and_has_no_groups(coordinator):
+    """A subscribed coordinator neither polls groups nor changes its tick."""
+    instance = coordinator(
+        [{"name": "fast", "nodeid": "ns=2;i=1", "scan_interval": 0.5}],
+        scan_interval=30,
+        subscription=True,
+    )
+    instance._update_scan_groups()
+
+    assert instance._scan_groups == {}
+    assert instance._fast_timers == {}
+    assert instance.update_interval == timedelta(seconds=30)
+
+
+def test_due_read_payload_merges_due_groups(coordinator):
+    """Only due groups are read, all of them while there is no data."""
+    instance = coordinator(
+        [
+            {"name": "a", "nodeid": "ns=2;i=1", "scan_interval": 2},
+            {"name": "b", "nodeid": "ns=2;i=2", "scan_interval": 4},
+        ]
+    )
+
+    node_key_pair, nodes, payload_key = instance._due_read_payload()
+    assert node_key_pair == {"ns=2;i=1": "ns=2;i=1", "ns=2;i=2": "ns=2;i=2"}
+    assert len(nodes) == 2
+    assert payload_key == frozenset((timedelta(seconds=2), timedelta(seconds=4)))
+
+    instance.data = {"a": 1, "b": 2}
+    instance._group_next_due[timedelta(seconds=2)] = 0.0
+    node_key_pair, nodes, payload_key = instance._due_read_payload()
+    assert node_key_pair == {"ns=2;i=1": "ns=2;i=1"}
+    assert [node.nodeid.to_string() for node in nodes] == ["ns=2;i=1"]
+    assert payload_key == frozenset((timedelta(seconds=2),))
+
+
+def test_due_read_payload_is_built_once_per_epoch(coordinator):
+    """The merged payload is cached until the hub moves to another client."""
+    instance = coordinator([{"name": "a", "nodeid": "ns=2;i=1"}])
+
+    first = instance._due_read_payload()
+    assert instance._due_read_payload()[0] is first[0]
+
+    instance.hub.node_epoch += 1
+    assert instance._due_read_payload()[0] is not first[0]
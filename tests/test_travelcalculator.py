@@ -0,0 +1,157 @@
+"""Tests of TravelCalculator and its banked counterpart."""
+import random
+
+import pytest
+
+from travelcalculator import (
+    TravelCalculator,
+    TravelCalculatorBank,
+    TravelStatus,
+    _position_at,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock of the calculators by a settable one."""
+    now = [1000.0]
+    monkeypatch.setattr(TravelCalculator, "current_time", staticmethod(lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def bank():
+    """Return an empty calculator bank."""
+    if not TravelCalculatorBank.available():
+        pytest.skip("numpy is not installed")
+    return TravelCalculatorBank(capacity=2)
+
+
+def _state(calculator):
+    """Return everything a cover reads from its calculator."""
+    return (
+        calculator.current_position(),
+        calculator.travel_direction_code,
+        calculator.travel_direction,
+        calculator.is_traveling(),
+        calculator.position_reached(),
+        calculator.is_open(),
+        calculator.is_closed(),
+        calculator.arrival_time(),
+        calculator.time_to_arrival(),
+    )
+
+
+def test_travel_position_and_arrival(clock):
+    """A cover moves linearly and arrives at the time it announced."""
+    calculator = TravelCalculator(20, 10)
+    calculator.set_position(0)
+    calculator.start_travel_up()
+
+    assert calculator.travel_direction_code == TravelStatus.DIRECTION_UP.value
+    assert calculator.arrival_time() == 1010.0
+
+    clock[0] += 2.5
+    assert calculator.current_position() == 25
+    assert calculator.is_traveling()
+
+    clock[0] += 7.5
+    assert calculator.current_position() == 100
+    assert calculator.position_reached()
+    assert calculator.is_open()
+
+
+def test_cached_position_follows_clock(clock):
+    """The position kept between whole steps matches a fresh calculation."""
+    calculator = TravelCalculator(100, 100)
+    calculator.set_position(50)
+    calculator.start_travel_down()
+    started = clock[0]
+
+    for _step in range(200):
+        clock[0] += 0.25
+        expected, _until = _position_at(
+            50, 0, TravelStatus.DIRECTION_DOWN.value, started, 100, 100, 100, clock[0]
+        )
+        assert calculator.current_position() == expected
+    assert calculator.is_closed()
+
+
+def test_stop_keeps_calculated_position(clock):
+    """Stopping freezes the cover where it was calculated to be."""
+    calculator = TravelCalculator(10, 10)
+    calculator.set_position(100)
+    calculator.start_travel(0)
+    clock[0] += 4
+
+    calculator.stop()
+    clock[0] += 4
+
+    assert calculator.current_position() == 60
+    assert calculator.travel_direction == TravelStatus.STOPPED
+    assert calculator.arrival_time() is None
+
+
+def test_bank_matches_scalar_calculators(clock, bank):
+    """Views, their bank and scalar calculators agree through random travel."""
+    rng = random.Random(4)
+    scalars = []
+    views = []
+    for _ in range(12):
+        down, up = rng.randint(5, 60), rng.randint(5, 60)
+        scalars.append(TravelCalculator(down, up))
+        views.append(bank.add(down, up))
+
+    for _ in range(300):
+        idx = rng.randrange(len(scalars))
+        action = rng.random()
+        position = rng.randint(0, 100)
+        for calculator in (scalars[idx], views[idx]):
+            if action < 0.1:
+                calculator.set_position(position)
+            elif action < 0.3:
+                calculator.start_travel(position)
+            elif action < 0.4:
+                calculator.stop()
+        clock[0] += rng.choice((0.05, 0.25, 1.0, 3.0))
+
+        expected = [_state(scalar) for scalar in scalars]
+        assert [_state(view) for view in views] == expected
+        positions = [state[0] for state in expected]
+        assert bank.current_positions().tolist() == positions
+        assert bank.freeze() == positions
+        assert [view.current_position() for view in views] == positions
+        bank.thaw()
+
+
+def test_frozen_bank_dropped_on_change(clock, bank):
+    """A view changed during a tick is read from its new state."""
+    view = bank.add(10, 10)
+    other = bank.add(10, 10)
+    view.set_position(0)
+    other.set_position(0)
+    view.start_travel_up()
+    clock[0] += 5
+
+    bank.freeze()
+    view.stop()
+
+    assert bank.frozen is None
+    assert view.current_position() == 50
+    assert other.current_position() == 0
+
+
+def test_released_row_starts_afresh(clock, bank):
+    """A row given back to the bank is reused stopped for the next cover."""
+    first = bank.add(10, 10)
+    first.set_position(0)
+    first.start_travel_up()
+    bank.release(first.row)
+
+    second = bank.add(20, 20)
+    second.set_position(30)
+    clock[0] += 5
+
+    assert second.row == first.row
+    assert bank.current_positions().tolist()[second.row] == 30
+    assert not second.is_traveling()
@@ -0,0 +1,89 @@
+"""Tests of the priority write lanes of OpcuaHub."""
+import asyncio
+
+import pytest
+
+integration = pytest.importorskip("custom_components.asyncua")
+
+WritePriority = integration.WritePriority
+
+
+@pytest.fixture
+def loop():
+    """Return an event loop for the futures of queued writes."""
+    instance = asyncio.new_event_loop()
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def hub():
+    """Return a hub that never connects."""
+    return integration.OpcuaHub(
+        "hub", "manufacturer", "model", "opc.tcp://127.0.0.1:4840"
+    )
+
+
+def _queue(hub, loop, priority, values):
+    """Put a write in a lane as set_values does and return its future."""
+    future = loop.create_future()
+    hub._write_lanes[priority].append((dict(values), future, 0.0))
+    return future
+
+
+def test_write_supersedes_same_node_in_own_lane(hub, loop):
+    """Only the superseded node of a waiting write is dropped."""
+    future = _queue(hub, loop, WritePriority.INTERACTIVE, {"a": 1, "b": 2})
+
+    hub._supersede_writes(WritePriority.INTERACTIVE, {"a": 5})
+
+    pending, _future, _queued = hub._write_lanes[WritePriority.INTERACTIVE][0]
+    assert pending == {"a": integration._SUPERSEDED, "b": 2}
+    assert not future.done()
+    assert hub.write_metrics["interactive"]["superseded"] == 1
+
+
+def test_stop_resolves_fully_superseded_lower_writes(hub, loop):
+    """A stop drops an open still waiting in a lower lane and answers it."""
+    interactive = _queue(hub, loop, WritePriority.INTERACTIVE, {"a": 1})
+    background = _queue(hub, loop, WritePriority.BACKGROUND, {"a": 2, "b": 3})
+
+    hub._supersede_writes(WritePriority.STOP, {"a": 0})
+
+    assert not hub._write_lanes[WritePriority.INTERACTIVE]
+    assert interactive.result() == {"a": False}
+    assert not background.done()
+    assert hub.write_metrics["background"]["superseded"] == 1
+
+
+def test_lower_priority_write_leaves_higher_lanes(hub, loop):
+    """A background write never drops a stop waiting to go out."""
+    stop = _queue(hub, loop, WritePriority.STOP, {"a": 0})
+
+    hub._supersede_writes(WritePriority.BACKGROUND, {"a": 1})
+
+    assert hub._write_lanes[WritePriority.STOP][0][0] == {"a": 0}
+    assert not stop.done()
+
+
+def test_set_values_reports_superseded_nodes(hub, loop):
+    """Callers get False for superseded nodes, the last value is written."""
+    written = []
+
+    async def write(values):
+        written.append(values)
+        return {nodeid: True for nodeid in values}
+
+    hub._async_set_values = write
+
+    async def run():
+        return await asyncio.gather(
+            hub.set_values({"a": 1, "b": 1}, WritePriority.INTERACTIVE),
+            hub.set_values({"a": 0}, WritePriority.STOP),
+        )
+
+    interactive, stop = loop.run_until_complete(run())
+
+    assert written == [{"a": 0}, {"b": 1}]
+    assert interactive == {"a": False, "b": True}
+    assert stop == {"a": True}
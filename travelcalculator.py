@@ -15,6 +15,11 @@ Thanks @farmio https://github.com/nagyrobi/home-assistant-custom-components-cove
 import time
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant
+    np = None
+
 
 class PositionType(Enum):
     """Enum class for different type of calculated positions."""
@@ -32,14 +37,71 @@ class TravelStatus(Enum):
     STOPPED = 3
 
 
+# Plain int codes of the enums above, compared in the position hot path
+_UNKNOWN = PositionType.UNKNOWN.value
+_CALCULATED = PositionType.CALCULATED.value
+_CONFIRMED = PositionType.CONFIRMED.value
+_DIRECTION_UP = TravelStatus.DIRECTION_UP.value
+_DIRECTION_DOWN = TravelStatus.DIRECTION_DOWN.value
+_STOPPED = TravelStatus.STOPPED.value
+
+_NEVER = float("-inf")
+_FOREVER = float("inf")
+
+
+def _position_at(
+    last, target, direction, started, travel_time_down, travel_time_up, span, now
+):
+    """Return the position of a travelling cover at time now, and until when it holds.
+
+    The position is an int, so it holds until the travel crosses the next
+    whole position; the calculators reuse it until then.
+    """
+    relative_position = target - last
+
+    if (relative_position >= 0 and direction == _DIRECTION_DOWN) \
+            or (relative_position <= 0 and direction == _DIRECTION_UP):
+        return target, _FOREVER
+
+    travel_time = (
+        travel_time_up if relative_position > 0 else travel_time_down
+    ) * abs(relative_position) / span
+    if now > started + travel_time:
+        return target, _FOREVER
+    progress = (now - started) / travel_time
+    position = int(last + relative_position * progress)
+
+    # Whole position at which the calculated position changes next
+    next_position = position + 1 if relative_position > 0 else position
+    return position, min(
+        started + travel_time * (next_position - last) / relative_position,
+        started + travel_time,
+    )
+
+
 class TravelCalculator:
     """Class for calculating the current position of a cover."""
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "_position_type",
+        "last_known_position",
+        "travel_time_down",
+        "travel_time_up",
+        "travel_to_position",
+        "travel_started_time",
+        "_travel_direction",
+        "position_closed",
+        "position_open",
+        "time_set_from_outside",
+        "_cached_position",
+        "_cached_until",
+    )
+
     def __init__(self, travel_time_down, travel_time_up):
         """Initialize TravelCalculator class."""
-        self.position_type = PositionType.UNKNOWN
+        self._position_type = _UNKNOWN
         self.last_known_position = 0
 
         self.travel_time_down = travel_time_down
@@ -47,7 +109,7 @@ class TravelCalculator:
 
         self.travel_to_position = 0
         self.travel_started_time = 0
-        self.travel_direction = TravelStatus.STOPPED
+        self._travel_direction = _STOPPED
 
         # 0 is closed, 100 is fully open
         self.position_closed = 0
@@ -55,30 +117,52 @@ class TravelCalculator:
 
         self.time_set_from_outside = None
 
+        # Calculated position and the time until which it stays unchanged
+        self._cached_position = 0
+        self._cached_until = _NEVER
+
+    @property
+    def position_type(self):
+        """Return the type of the current position."""
+        return PositionType(self._position_type)
+
+    @property
+    def travel_direction(self):
+        """Return the travel direction."""
+        return TravelStatus(self._travel_direction)
+
+    @property
+    def travel_direction_code(self):
+        """Return the travel direction as the int value of TravelStatus."""
+        return self._travel_direction
+
     def set_position(self, position):
         """Set known position of cover."""
         self.last_known_position = position
         self.travel_to_position = position
-        self.position_type = PositionType.CONFIRMED
+        self._position_type = _CONFIRMED
+        self._cached_until = _NEVER
 
     def stop(self):
         """Stop traveling."""
         self.last_known_position = self.current_position()
         self.travel_to_position = self.last_known_position
-        self.position_type = PositionType.CALCULATED
-        self.travel_direction = TravelStatus.STOPPED
+        self._position_type = _CALCULATED
+        self._travel_direction = _STOPPED
+        self._cached_until = _NEVER
 
     def start_travel(self, travel_to_position):
         """Start traveling to position."""
         self.stop()
         self.travel_started_time = self.current_time()
         self.travel_to_position = travel_to_position
-        self.position_type = PositionType.CALCULATED
+        self._position_type = _CALCULATED
 
-        self.travel_direction = \
-            TravelStatus.DIRECTION_UP \
+        self._travel_direction = \
+            _DIRECTION_UP \
             if travel_to_position > self.last_known_position else \
-            TravelStatus.DIRECTION_DOWN
+            _DIRECTION_DOWN
+        self._cached_until = _NEVER
 
     def start_travel_up(self):
         """Start traveling up."""
@@ -90,9 +174,12 @@ class TravelCalculator:
 
     def current_position(self):
         """Return current (calculated or known) position."""
-        if self.position_type == PositionType.CALCULATED:
-            return self._calculate_position()
-        return self.last_known_position
+        if self._position_type != _CALCULATED:
+            return self.last_known_position
+        now = self.current_time()
+        if now >= self._cached_until:
+            self._calculate_position(now)
+        return self._cached_position
 
     def is_traveling(self):
         """Return if cover is traveling."""
@@ -102,6 +189,25 @@ class TravelCalculator:
         """Return if cover has reached designated position."""
         return self.current_position() == self.travel_to_position
 
+    def arrival_time(self):
+        """Return the time at which the designated position is reached.
+
+        Returns None if the cover is not traveling.
+        """
+        if self._position_type != _CALCULATED \
+                or self._travel_direction == _STOPPED:
+            return None
+        relative_position = self.travel_to_position - self.last_known_position
+        return self.travel_started_time \
+            + self._calculate_travel_time(relative_position)
+
+    def time_to_arrival(self):
+        """Return seconds until the designated position is reached."""
+        arrival_time = self.arrival_time()
+        if arrival_time is None:
+            return None
+        return max(0, arrival_time - self.current_time())
+
     def is_open(self):
         """Return if cover is (fully) open."""
         return self.current_position() == self.position_open
@@ -112,43 +218,318 @@ class TravelCalculator:
 
     @staticmethod
     def current_time():
-        """Return current time in seconds."""
-        return time.time()
-
-    def _calculate_position(self):
-        """Return calculated position."""
-        relative_position = self.travel_to_position - self.last_known_position
-
-        def position_reached_or_exceeded(relative_position):
-            """Return if designated position was reached."""
-            if relative_position >= 0 \
-                    and self.travel_direction == TravelStatus.DIRECTION_DOWN:
-                return True
-            if relative_position <= 0 \
-                    and self.travel_direction == TravelStatus.DIRECTION_UP:
-                return True
-            return False
-
-        if position_reached_or_exceeded(relative_position):
-            return self.travel_to_position
-
-        travel_time = self._calculate_travel_time(relative_position)
-        if self.current_time() > self.travel_started_time + travel_time:
-            return self.travel_to_position
-        progress = (self.current_time()-self.travel_started_time)/travel_time
-        position = self.last_known_position + relative_position * progress
-        return int(position)
+        """Return current time in seconds.
+
+        Monotonic, so wall clock adjustments do not move the cover.
+        """
+        return time.monotonic()
+
+    def _calculate_position(self, now):
+        """Calculate the position at time now and how long it stays valid."""
+        self._cached_position, self._cached_until = _position_at(
+            self.last_known_position,
+            self.travel_to_position,
+            self._travel_direction,
+            self.travel_started_time,
+            self.travel_time_down,
+            self.travel_time_up,
+            self.position_open - self.position_closed,
+            now,
+        )
 
     def _calculate_travel_time(self, relative_position):
         """Calculate time to travel to relative position."""
-        travel_direction = \
-            TravelStatus.DIRECTION_UP \
-            if relative_position > 0 else \
-            TravelStatus.DIRECTION_DOWN
         travel_time_full = \
             self.travel_time_up \
-            if travel_direction == TravelStatus.DIRECTION_UP else \
+            if relative_position > 0 else \
             self.travel_time_down
         travel_range = self.position_open - self.position_closed
 
         return travel_time_full * abs(relative_position) / travel_range
+
+
+
+class TravelCalculatorBank:
+    """Calculate the current position of many covers at once.
+
+    The state of every cover is held in one row of contiguous NumPy arrays,
+    so all positions are computed in a single vectorized pass with a single
+    clock read. Each cover works with a BankedTravelCalculator view onto its
+    row, which offers the same interface as TravelCalculator.
+
+    A single row is slower to compute through NumPy than a TravelCalculator,
+    so the bank pays off only for a large fleet of covers. The motion
+    tick computes every position once with freeze() and the views read the
+    row computed for that tick; outside a tick a view calculates its own
+    row in plain Python, memoized like TravelCalculator.
+    """
+
+    position_closed = 0
+    position_open = 100
+
+    def __init__(self, capacity=16):
+        """Initialize TravelCalculatorBank class."""
+        if np is None:
+            raise RuntimeError("TravelCalculatorBank requires numpy")
+        self._size = 0
+        self._free_rows = []
+        # Positions of the current motion tick, by row, until thaw()
+        self.frozen = None
+        self._allocate(capacity)
+
+    @staticmethod
+    def available():
+        """Return if numpy is installed."""
+        return np is not None
+
+    def _allocate(self, capacity):
+        """Create or grow the row arrays to the given capacity."""
+        arrays = {
+            "last_known_position": np.zeros(capacity, dtype=np.float64),
+            "travel_to_position": np.zeros(capacity, dtype=np.float64),
+            "travel_started_time": np.zeros(capacity, dtype=np.float64),
+            "travel_direction": np.full(
+                capacity,
+                _STOPPED,
+                dtype=np.int8,
+            ),
+            "travel_time_down": np.ones(capacity, dtype=np.float64),
+            "travel_time_up": np.ones(capacity, dtype=np.float64),
+            "calculated": np.zeros(capacity, dtype=bool),
+        }
+        for name, array in arrays.items():
+            if self._size:
+                array[: self._size] = getattr(self, name)[: self._size]
+            setattr(self, name, array)
+        self._capacity = capacity
+
+    def add(self, travel_time_down, travel_time_up):
+        """Add a cover and return the calculator view onto its row."""
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self._size == self._capacity:
+                self._allocate(self._capacity * 2)
+            row = self._size
+            self._size += 1
+        self.last_known_position[row] = 0
+        self.travel_to_position[row] = 0
+        self.travel_started_time[row] = 0
+        self.travel_direction[row] = _STOPPED
+        self.travel_time_down[row] = travel_time_down
+        self.travel_time_up[row] = travel_time_up
+        self.calculated[row] = False
+        return BankedTravelCalculator(self, row, travel_time_down, travel_time_up)
+
+    def release(self, row):
+        """Free the row of a removed cover for reuse."""
+        self.calculated[row] = False
+        self.travel_direction[row] = _STOPPED
+        self._free_rows.append(row)
+
+    @staticmethod
+    def current_time():
+        """Return current time in seconds."""
+        return TravelCalculator.current_time()
+
+    def current_positions(self, now=None):
+        """Return the current position of every row, indexed by row."""
+        if now is None:
+            now = self.current_time()
+        return self._positions(slice(0, self._size), now)
+
+    def freeze(self, now=None):
+        """Compute every position once and serve the views from it until thaw()."""
+        self.frozen = self.current_positions(now).tolist()
+        return self.frozen
+
+    def thaw(self):
+        """Let the views calculate their position again."""
+        self.frozen = None
+
+    def _positions(self, rows, now):
+        """Return the positions of the given rows at time now."""
+        last = self.last_known_position[rows]
+        target = self.travel_to_position[rows]
+        direction = self.travel_direction[rows]
+        relative = target - last
+
+        travel_time = (
+            np.where(relative > 0, self.travel_time_up[rows], self.travel_time_down[rows])
+            * np.abs(relative)
+            / (self.position_open - self.position_closed)
+        )
+        elapsed = now - self.travel_started_time[rows]
+        reached = (
+            ((relative >= 0) & (direction == _DIRECTION_DOWN))
+            | ((relative <= 0) & (direction == _DIRECTION_UP))
+            | (elapsed > travel_time)
+        )
+        progress = elapsed / np.where(travel_time > 0, travel_time, 1)
+        moving = np.trunc(last + relative * progress)
+
+        positions = np.where(
+            self.calculated[rows], np.where(reached, target, moving), last
+        )
+        return positions.astype(np.int64)
+
+
+class BankedTravelCalculator:
+    """View onto one row of a TravelCalculatorBank.
+
+    Mirrors the TravelCalculator interface so covers can use either. The
+    view keeps its row in plain attributes too, as reading single elements
+    of the bank arrays is slower than the whole vectorized pass; it writes
+    every change through to the bank.
+    """
+
+    __slots__ = (
+        "_bank",
+        "row",
+        "position_closed",
+        "position_open",
+        "last_known_position",
+        "travel_to_position",
+        "travel_started_time",
+        "_travel_direction",
+        "_calculated",
+        "travel_time_down",
+        "travel_time_up",
+        "_cached_position",
+        "_cached_until",
+    )
+
+    def __init__(self, bank, row, travel_time_down, travel_time_up):
+        """Initialize BankedTravelCalculator class."""
+        self._bank = bank
+        self.row = row
+        self.position_closed = bank.position_closed
+        self.position_open = bank.position_open
+
+        self.last_known_position = 0
+        self.travel_to_position = 0
+        self.travel_started_time = 0
+        self._travel_direction = _STOPPED
+        self._calculated = False
+        self.travel_time_down = travel_time_down
+        self.travel_time_up = travel_time_up
+
+        # Calculated position and the time until which it stays unchanged
+        self._cached_position = 0
+        self._cached_until = _NEVER
+
+    @property
+    def travel_direction(self):
+        """Return the travel direction."""
+        return TravelStatus(self._travel_direction)
+
+    @property
+    def travel_direction_code(self):
+        """Return the travel direction as the int value of TravelStatus."""
+        return self._travel_direction
+
+    def _write_row(self):
+        """Write the row through to the bank and drop calculated positions."""
+        bank, row = self._bank, self.row
+        bank.last_known_position[row] = self.last_known_position
+        bank.travel_to_position[row] = self.travel_to_position
+        bank.travel_started_time[row] = self.travel_started_time
+        bank.travel_direction[row] = self._travel_direction
+        bank.calculated[row] = self._calculated
+        self._cached_until = _NEVER
+        bank.frozen = None
+
+    def set_position(self, position):
+        """Set known position of cover."""
+        self.last_known_position = position
+        self.travel_to_position = position
+        self._calculated = False
+        self._write_row()
+
+    def stop(self):
+        """Stop traveling."""
+        self.last_known_position = self.current_position()
+        self.travel_to_position = self.last_known_position
+        self._calculated = True
+        self._travel_direction = _STOPPED
+        self._write_row()
+
+    def start_travel(self, travel_to_position):
+        """Start traveling to position."""
+        self.stop()
+        self.travel_started_time = self._bank.current_time()
+        self.travel_to_position = travel_to_position
+        self._travel_direction = (
+            _DIRECTION_UP
+            if travel_to_position > self.last_known_position
+            else _DIRECTION_DOWN
+        )
+        self._write_row()
+
+    def start_travel_up(self):
+        """Start traveling up."""
+        self.start_travel(self.position_open)
+
+    def start_travel_down(self):
+        """Start traveling down."""
+        self.start_travel(self.position_closed)
+
+    def current_position(self):
+        """Return current (calculated or known) position.
+
+        Read from the row frozen for the motion tick when there is one.
+        """
+        frozen = self._bank.frozen
+        if frozen is not None:
+            return frozen[self.row]
+        if not self._calculated:
+            return self.last_known_position
+        now = self._bank.current_time()
+        if now >= self._cached_until:
+            self._cached_position, self._cached_until = _position_at(
+                self.last_known_position,
+                self.travel_to_position,
+                self._travel_direction,
+                self.travel_started_time,
+                self.travel_time_down,
+                self.travel_time_up,
+                self.position_open - self.position_closed,
+                now,
+            )
+        return self._cached_position
+
+    def is_traveling(self):
+        """Return if cover is traveling."""
+        return self.current_position() != self.travel_to_position
+
+    def position_reached(self):
+        """Return if cover has reached designated position."""
+        return self.current_position() == self.travel_to_position
+
+    def arrival_time(self):
+        """Return the time at which the designated position is reached.
+
+        Returns None if the cover is not traveling.
+        """
+        if not self._calculated or self._travel_direction == _STOPPED:
+            return None
+        relative_position = self.travel_to_position - self.last_known_position
+        travel_time_full = \
+            self.travel_time_up if relative_position > 0 else self.travel_time_down
+        return self.travel_started_time + travel_time_full \
+            * abs(relative_position) / (self.position_open - self.position_closed)
+
+    def time_to_arrival(self):
+        """Return seconds until the designated position is reached."""
+        arrival_time = self.arrival_time()
+        if arrival_time is None:
+            return None
+        return max(0, arrival_time - self._bank.current_time())
+
+    def is_open(self):
+        """Return if cover is (fully) open."""
+        return self.current_position() == self.position_open
+
+    def is_closed(self):
+        """Return if cover is (fully) closed."""
+        return self.current_position() == self.position_closed